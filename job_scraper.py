@@ -11,6 +11,22 @@ from urllib.parse import urlparse
 from typing import Dict, Optional, Tuple
 import time
 
+# Phrases that mark LinkedIn UI boilerplate vs. real job content. Matched as
+# substrings: get_text(strip=True) glues adjacent strings without spaces.
+LINKEDIN_UI_INDICATORS = (
+    'apply', 'join', 'sign in', 'first name', 'last name', 'email', 'password',
+    'agree & join', 'continue', 'security verification', 'already on linkedin',
+    'new to linkedin', 'remove photo', 'forgot password', 'show', 'hide'
+)
+LINKEDIN_JOB_INDICATORS = (
+    'requirements', 'qualifications', 'responsibilities', 'about', 'role', 'position',
+    'experience', 'skills', 'duties', 'expectations', 'candidate', 'applicant',
+    'job description', 'what you will do', 'what you\'ll do', 'key responsibilities',
+    'essential functions', 'opportunity', 'mission', 'company', 'team'
+)
+LINKEDIN_UI_RE = re.compile('|'.join(map(re.escape, LINKEDIN_UI_INDICATORS)))
+LINKEDIN_JOB_RE = re.compile('|'.join(map(re.escape, LINKEDIN_JOB_INDICATORS)))
+
 class JobDescriptionScraper:
     """Scraper for job descriptions from various websites"""
     
@@ -138,21 +154,9 @@ class JobDescriptionScraper:
                     # Filter out content that's clearly UI boilerplate
                     if text and len(text) > 200:
                         # Check if this looks like actual job content (not UI elements)
-                        ui_indicators = [
-                            'apply', 'join', 'sign in', 'first name', 'last name', 'email', 'password',
-                            'agree & join', 'continue', 'security verification', 'already on linkedin',
-                            'new to linkedin', 'remove photo', 'forgot password', 'show', 'hide'
-                        ]
-                        
-                        has_ui_content = any(indicator in text.lower() for indicator in ui_indicators)
-                        job_indicators = [
-                            'requirements', 'qualifications', 'responsibilities', 'about', 'role', 'position',
-                            'experience', 'skills', 'duties', 'expectations', 'candidate', 'applicant',
-                            'job description', 'what you will do', 'what you\'ll do', 'key responsibilities',
-                            'essential functions', 'opportunity', 'mission', 'company', 'team'
-                        ]
-                        
-                        has_job_content = any(indicator in text.lower() for indicator in job_indicators)
+                        text_lower = text.lower()
+                        has_ui_content = LINKEDIN_UI_RE.search(text_lower) is not None
+                        has_job_content = LINKEDIN_JOB_RE.search(text_lower) is not None
                         
                         # Prefer content that has job indicators and minimal UI content
                         if has_job_content and not has_ui_content and len(text) > len(description):
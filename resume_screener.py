@@ -5,10 +5,20 @@ Converts the n8n workflow to a Python-based system with web interface
 
 import os
 import re
-from typing import TypedDict, Optional, List, Dict, Any
+import sys
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from typing import Optional, List, Dict, Any, Union
 from urllib.parse import urlparse, parse_qs
+import io
 import tempfile
-import requests
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -16,17 +26,22 @@ load_dotenv()
 
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
-import google.auth
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
-import io
-import PyPDF2
-from docx import Document
+
+# PyMuPDF is much faster than PyPDF2 and keeps multi-column layouts readable.
+# The fallback parsers (PyPDF2, pdfplumber, pytesseract) and python-docx are
+# imported on first use so importing this module stays cheap.
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
 
 # Google API scopes
 SCOPES = [
@@ -34,32 +49,103 @@ SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets'
 ]
 
-class ResumeScreeningState(TypedDict):
+# Read once after load_dotenv() so LLM clients don't consult os.environ per call
+OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+
+LLM_MODEL = "gpt-4o-mini"
+
+# Parallelism for screen_many(): Drive download/parse workers and in-flight LLM requests
+IO_MAX_WORKERS = 8
+LLM_MAX_CONCURRENCY = 16
+
+# Precompiled patterns for Drive link parsing
+DRIVE_ID_RE = re.compile(r'/(?:file|document|spreadsheets)/d/([a-zA-Z0-9_-]+)')
+
+# Resume trimming before the LLM: keep the contact preamble and these sections
+RESUME_MAX_CHARS = 6000
+RESUME_SECTION_RE = re.compile(
+    r'^\s*(summary|profile|objective|experience|work experience|professional experience|'
+    r'work history|employment|skills|technical skills|education|projects|certifications|'
+    r'awards|publications|interests|hobbies|references|volunteer\w*|languages)\s*:?\s*$',
+    re.IGNORECASE | re.MULTILINE
+)
+RESUME_KEEP_SECTIONS = ('summary', 'profile', 'objective', 'experience', 'work', 'professional',
+                        'employment', 'skills', 'technical', 'education', 'projects', 'certifications')
+
+# LLM replies keyed by a hash of the model and prompt, so re-screens skip the API
+LLM_CACHE_DIR = os.environ.get("SCREENER_CACHE_DIR", ".screener_cache")
+# In-process layer in front of the disk cache, so repeat prompts skip the file read and JSON parse
+LLM_MEMORY_CACHE_SIZE = 128
+_LLM_MEMORY_CACHE: "OrderedDict[str, BaseModel]" = OrderedDict()
+_LLM_MEMORY_CACHE_LOCK = threading.Lock()
+
+# Authorized Drive API client, built once per thread and reused across nodes
+_DRIVE_SERVICE_LOCAL = threading.local()
+
+# Google Docs have no binary content and must be exported rather than downloaded
+GOOGLE_DOC_MIME_TYPE = "application/vnd.google-apps.document"
+
+# Downloaded Drive files, keyed by file ID, reused for an hour
+DRIVE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "resume_cache")
+DRIVE_CACHE_TTL = 3600
+DRIVE_CACHE_KEY_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# A PDF tier must yield at least this much text before later tiers are skipped
+PDF_MIN_TEXT_CHARS = 50
+PDF_OCR_DPI = 200
+# Only the first pages of a scanned PDF are rasterized and OCR'd; resumes rarely run longer
+PDF_OCR_MAX_PAGES = 20
+
+# Extracted PDF text keyed by the SHA-256 of the file bytes (LRU)
+PDF_TEXT_CACHE_SIZE = 256
+_PDF_TEXT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_PDF_TEXT_CACHE_LOCK = threading.Lock()
+
+# A downloaded file: the path of its on-disk cache copy, or its bytes
+FileSource = Union[str, bytes]
+
+# slots=True needs Python 3.10+; fall back to a regular dataclass on 3.9
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ResumeScreeningState:
     """State for the resume screening workflow"""
     # Input
     google_drive_link: str
     job_description: str
     
     # Processing
-    file_id: Optional[str]
-    file_name: Optional[str]
-    file_type: Optional[str]
-    resume_text: Optional[str]
+    file_id: Optional[str] = None
+    file_name: Optional[str] = None
+    file_type: Optional[str] = None
+    resume_text: Optional[str] = None
     
     # AI Analysis
-    screening_results: Optional[Dict[str, Any]]
-    candidate_info: Optional[Dict[str, str]]
+    screening_results: Optional[Dict[str, Any]] = None
+    candidate_info: Optional[Dict[str, str]] = None
     
     # Output
-    spreadsheet_data: Optional[Dict[str, Any]]
-    error: Optional[str]
+    spreadsheet_data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-style read, for callers written against the old TypedDict state"""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+class FactorAssessment(BaseModel):
+    """Score and explanation for a risk or reward factor"""
+    score: str = Field(description="Low/Medium/High")
+    explanation: str = Field(description="Explanation for the score")
 
 class ScreeningResults(BaseModel):
     """Structured output for resume screening"""
     candidate_strengths: List[str] = Field(description="List of candidate strengths matching job requirements")
     candidate_weaknesses: List[str] = Field(description="List of areas where candidate lacks alignment")
-    risk_factor: Dict[str, str] = Field(description="Risk assessment with score and explanation")
-    reward_factor: Dict[str, str] = Field(description="Reward assessment with score and explanation")
+    risk_factor: FactorAssessment = Field(description="Risk assessment with score and explanation")
+    reward_factor: FactorAssessment = Field(description="Reward assessment with score and explanation")
     overall_fit_rating: int = Field(description="Fit rating from 0-10", ge=0, le=10)
     justification_for_rating: str = Field(description="Explanation for the fit rating")
 
@@ -69,14 +155,154 @@ class CandidateInfo(BaseModel):
     last_name: str = Field(description="Candidate's last name")
     email_address: str = Field(description="Candidate's email address")
 
+class CombinedAnalysis(ScreeningResults, CandidateInfo):
+    """Screening report and candidate information returned by a single LLM call"""
+
+@lru_cache(maxsize=None)
+def _get_llm(temperature: float) -> ChatOpenAI:
+    """Shared gpt-4o-mini client per temperature, so nodes reuse one connection pool"""
+    return ChatOpenAI(
+        model=LLM_MODEL,
+        temperature=temperature,
+        api_key=OPENAI_API_KEY
+    )
+
+@lru_cache(maxsize=None)
+def _get_structured_llm(schema: type, temperature: float):
+    """Shared structured-output runnable, built on first use so importing needs no API key"""
+    return _get_llm(temperature).with_structured_output(schema, method="json_schema")
+
+def _llm_cache_key(messages: List[BaseMessage]) -> str:
+    """Content hash of the model and prompt messages"""
+    digest = hashlib.sha256(LLM_MODEL.encode())
+    for message in messages:
+        digest.update(b"\0" + message.type.encode() + b"\0" + message.content.encode())
+    return digest.hexdigest()
+
+def _llm_cache_get(key: str, schema: type) -> Optional[BaseModel]:
+    """Load a cached structured reply, or None on a miss"""
+    with _LLM_MEMORY_CACHE_LOCK:
+        reply = _LLM_MEMORY_CACHE.get(key)
+        if isinstance(reply, schema):
+            _LLM_MEMORY_CACHE.move_to_end(key)
+            return reply
+    try:
+        with open(os.path.join(LLM_CACHE_DIR, f"{key}.json"), "rb") as cached:
+            reply = schema.model_validate_json(cached.read())
+    except (OSError, ValueError):
+        return None
+    _llm_memory_put(key, reply)
+    return reply
+
+def _llm_memory_put(key: str, reply: BaseModel) -> None:
+    """Remember a reply in the bounded in-process LRU"""
+    with _LLM_MEMORY_CACHE_LOCK:
+        _LLM_MEMORY_CACHE[key] = reply
+        _LLM_MEMORY_CACHE.move_to_end(key)
+        if len(_LLM_MEMORY_CACHE) > LLM_MEMORY_CACHE_SIZE:
+            _LLM_MEMORY_CACHE.popitem(last=False)
+
+def _llm_cache_put(key: str, reply: BaseModel) -> None:
+    """Store a structured reply (best effort, atomic rename)"""
+    _llm_memory_put(key, reply)
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=LLM_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as out:
+            out.write(reply.model_dump_json().encode())
+        os.replace(tmp_path, os.path.join(LLM_CACHE_DIR, f"{key}.json"))
+    except OSError:
+        pass
+
+def _invoke_cached(node, state: ResumeScreeningState) -> BaseModel:
+    """Return the node's structured reply for this state, calling the LLM only on a cache miss"""
+    messages = node._build_messages(state)
+    key = _llm_cache_key(messages)
+    reply = _llm_cache_get(key, node.schema)
+    if reply is None:
+        reply = node.llm.invoke(messages)
+        _llm_cache_put(key, reply)
+    return reply
+
+def _run_llm_batch(node, states: List[ResumeScreeningState], max_concurrency: int,
+                   error_prefix: str) -> List[ResumeScreeningState]:
+    """Send one LLM request per error-free, uncached state through llm.batch() and merge the replies"""
+    results = list(states)
+    pending = []
+    for i, state in enumerate(states):
+        if state.error:
+            continue
+        messages = node._build_messages(state)
+        key = _llm_cache_key(messages)
+        reply = _llm_cache_get(key, node.schema)
+        if reply is not None:
+            results[i] = node._apply(state, reply)
+        else:
+            pending.append((i, key, messages))
+    if not pending:
+        return results
+    
+    responses = node.llm.batch(
+        [messages for _, _, messages in pending],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    )
+    
+    for (i, key, _), response in zip(pending, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            results[i] = node._apply(states[i], response)
+            _llm_cache_put(key, response)
+        except Exception as e:
+            results[i] = replace(states[i], error=f"{error_prefix}: {str(e)}")
+    
+    return results
+
+def _trim_resume(text: str) -> str:
+    """Normalize whitespace and keep only the parts of a long resume the LLM needs"""
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\s*\n\s*', '\n', text).strip()
+    if len(text) <= RESUME_MAX_CHARS:
+        return text
+    
+    headers = list(RESUME_SECTION_RE.finditer(text))
+    if headers:
+        # Preamble (name and contact details) plus the relevant sections, in order
+        parts = [text[:headers[0].start()]]
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            if header.group(1).lower().startswith(RESUME_KEEP_SECTIONS):
+                parts.append(text[header.start():next_header.start() if next_header else len(text)])
+        text = "\n".join(part.strip() for part in parts if part.strip())
+    
+    return text[:RESUME_MAX_CHARS]
+
+def _as_file(source: FileSource):
+    """Path or bytes -> something python-docx/PyPDF2/pdfplumber can open"""
+    return source if isinstance(source, str) else io.BytesIO(source)
+
+def _open_pymupdf(source: FileSource):
+    """Open a PDF from a path (memory-mapped by MuPDF) or from bytes"""
+    if isinstance(source, str):
+        return pymupdf.open(source, filetype="pdf")
+    return pymupdf.open(stream=source, filetype="pdf")
+
+def _drive_cache_path(file_id: str) -> Optional[str]:
+    """Cache file path for a Drive file ID, or None if the ID is not path-safe"""
+    if not DRIVE_CACHE_KEY_RE.match(file_id):
+        return None
+    return os.path.join(DRIVE_CACHE_DIR, file_id)
+
 class FileProcessorNode:
     """Process Google Drive link and extract file information"""
     
-    def __init__(self):
-        self._drive_service = None
-    
     def _get_drive_service(self):
-        """Initialize Google Drive service"""
+        """Return this thread's Google Drive service, authorizing it on first use"""
+        # httplib2 connections are not thread-safe, so each worker keeps its own
+        drive_service = getattr(_DRIVE_SERVICE_LOCAL, "service", None)
+        if drive_service is not None:
+            return drive_service
+        
         creds = None
         if os.path.exists('token.json'):
             creds = Credentials.from_authorized_user_file('token.json', SCOPES)
@@ -92,32 +318,24 @@ class FileProcessorNode:
             with open('token.json', 'w') as token:
                 token.write(creds.to_json())
         
-        return build('drive', 'v3', credentials=creds)
+        drive_service = build('drive', 'v3', credentials=creds)
+        _DRIVE_SERVICE_LOCAL.service = drive_service
+        return drive_service
     
     def _extract_file_id(self, drive_link: str) -> str:
         """Extract file ID from Google Drive link"""
-        # Handle different Google Drive link formats
-        if '/file/d/' in drive_link:
-            # Format: https://drive.google.com/file/d/FILE_ID/view
-            match = re.search(r'/file/d/([a-zA-Z0-9-_]+)', drive_link)
-            if match:
-                return match.group(1)
-        elif 'id=' in drive_link:
+        # Formats: drive.google.com/file/d/FILE_ID/view,
+        # docs.google.com/document/d/FILE_ID/edit, docs.google.com/spreadsheets/d/FILE_ID/edit
+        match = DRIVE_ID_RE.search(drive_link)
+        if match:
+            return match.group(1)
+        
+        if 'id=' in drive_link:
             # Format: https://drive.google.com/open?id=FILE_ID
             parsed = urlparse(drive_link)
             query_params = parse_qs(parsed.query)
             if 'id' in query_params:
                 return query_params['id'][0]
-        elif '/document/d/' in drive_link:
-            # Format: https://docs.google.com/document/d/FILE_ID/edit
-            match = re.search(r'/document/d/([a-zA-Z0-9-_]+)', drive_link)
-            if match:
-                return match.group(1)
-        elif '/spreadsheets/d/' in drive_link:
-            # Format: https://docs.google.com/spreadsheets/d/FILE_ID/edit
-            match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', drive_link)
-            if match:
-                return match.group(1)
         
         raise ValueError(f"Invalid Google Drive link format: {drive_link[:50]}...")
     
@@ -125,38 +343,38 @@ class FileProcessorNode:
         """Process the Google Drive link and extract file info"""
         try:
             # If we already have resume text, skip file processing
-            if state.get("resume_text"):
-                return {
-                    **state,
-                    "file_id": None,
-                    "file_name": "Direct Text Input",
-                    "file_type": "text",
-                    "error": None
-                }
+            if state.resume_text:
+                return replace(
+                    state,
+                    file_id=None,
+                    file_name="Direct Text Input",
+                    file_type="text",
+                    error=None
+                )
             
             # If no Google Drive link provided, return error
-            if not state["google_drive_link"]:
-                return {
-                    **state,
-                    "error": "No Google Drive link provided and no resume text available"
-                }
+            if not state.google_drive_link:
+                return replace(
+                    state,
+                    error="No Google Drive link provided and no resume text available"
+                )
             
             # Extract file ID from link
-            file_id = self._extract_file_id(state["google_drive_link"])
+            file_id = self._extract_file_id(state.google_drive_link)
             
             # Get drive service
             try:
                 drive_service = self._get_drive_service()
             except FileNotFoundError:
-                return {
-                    **state,
-                    "error": "Google Drive service not available. Please check credentials.json file."
-                }
+                return replace(
+                    state,
+                    error="Google Drive service not available. Please check credentials.json file."
+                )
             except Exception as e:
-                return {
-                    **state,
-                    "error": f"Google Drive service error: {str(e)}"
-                }
+                return replace(
+                    state,
+                    error=f"Google Drive service error: {str(e)}"
+                )
             
             # Get file metadata
             file_metadata = drive_service.files().get(
@@ -167,7 +385,10 @@ class FileProcessorNode:
             mime_type = file_metadata.get('mimeType', '')
             
             # Determine file type
-            if 'pdf' in mime_type:
+            if mime_type == GOOGLE_DOC_MIME_TYPE:
+                # Docs Editors files have no binary content; they are exported instead
+                file_type = 'gdoc'
+            elif 'pdf' in mime_type:
                 file_type = 'pdf'
             elif 'word' in mime_type or 'document' in mime_type:
                 file_type = 'docx'
@@ -176,19 +397,19 @@ class FileProcessorNode:
             else:
                 file_type = 'unknown'
             
-            return {
-                **state,
-                "file_id": file_id,
-                "file_name": file_name,
-                "file_type": file_type,
-                "error": None
-            }
+            return replace(
+                state,
+                file_id=file_id,
+                file_name=file_name,
+                file_type=file_type,
+                error=None
+            )
             
         except Exception as e:
-            return {
-                **state,
-                "error": f"Error processing file: {str(e)}"
-            }
+            return replace(
+                state,
+                error=f"Error processing file: {str(e)}"
+            )
 
 class TextExtractorNode:
     """Extract text from various file formats"""
@@ -196,262 +417,359 @@ class TextExtractorNode:
     def __init__(self):
         self.file_processor = FileProcessorNode()
     
-    def _download_file(self, file_id: str) -> bytes:
-        """Download file from Google Drive"""
+    def _download_file(self, file_id: str, export_mime_type: Optional[str] = None) -> FileSource:
+        """Download (or export) a Drive file; returns its cache path, or bytes if uncached"""
+        cache_path = _drive_cache_path(file_id)
+        if cache_path:
+            try:
+                if time.time() - os.path.getmtime(cache_path) < DRIVE_CACHE_TTL:
+                    return cache_path
+            except OSError:
+                pass  # Not cached yet (or unreadable); download below
+        
         drive_service = self.file_processor._get_drive_service()
         if drive_service is None:
             raise Exception("Google Drive service not available")
             
-        request = drive_service.files().get_media(fileId=file_id)
+        if export_mime_type:
+            request = drive_service.files().export_media(fileId=file_id, mimeType=export_mime_type)
+        else:
+            request = drive_service.files().get_media(fileId=file_id)
+        
+        if cache_path:
+            # Stream chunks straight into the cache file instead of an in-memory buffer
+            try:
+                os.makedirs(DRIVE_CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=DRIVE_CACHE_DIR)
+            except OSError:
+                pass  # Caching is best effort; fall back to memory below
+            else:
+                try:
+                    with os.fdopen(fd, 'wb') as file:
+                        self._stream_media(request, file)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                return cache_path
+        
         file = io.BytesIO()
+        self._stream_media(request, file)
+        return file.getvalue()
+    
+    def _stream_media(self, request, file) -> None:
+        """Write a Drive media request to a file object chunk by chunk"""
         downloader = MediaIoBaseDownload(file, request)
         done = False
         while done is False:
             status, done = downloader.next_chunk()
-        
-        return file.getvalue()
     
-    def _extract_pdf_text(self, file_content: bytes) -> str:
-        """Extract text from PDF"""
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+    def _extract_pdf_text(self, source: FileSource) -> str:
+        """Extract text from PDF, reusing the result for identical files"""
+        if isinstance(source, str):
+            # Cache files are replaced atomically, so path + mtime + size identifies the content
+            stat = os.stat(source)
+            key = f"{source}:{stat.st_mtime_ns}:{stat.st_size}"
+        else:
+            key = hashlib.sha256(source).hexdigest()
+        with _PDF_TEXT_CACHE_LOCK:
+            if key in _PDF_TEXT_CACHE:
+                _PDF_TEXT_CACHE.move_to_end(key)
+                return _PDF_TEXT_CACHE[key]
+        
+        text = self._parse_pdf(source)
+        
+        with _PDF_TEXT_CACHE_LOCK:
+            _PDF_TEXT_CACHE[key] = text
+            if len(_PDF_TEXT_CACHE) > PDF_TEXT_CACHE_SIZE:
+                _PDF_TEXT_CACHE.popitem(last=False)
         return text
     
-    def _extract_docx_text(self, file_content: bytes) -> str:
+    def _parse_pdf(self, source: FileSource) -> str:
+        """Parse a PDF with the cheapest extractor that finds real text"""
+        best = ""
+        for extractor in (self._try_pymupdf, self._try_pypdf2, self._try_pdfplumber, self._try_ocr):
+            text = extractor(source)
+            if len(text.strip()) >= PDF_MIN_TEXT_CHARS:
+                return text
+            if len(text.strip()) > len(best.strip()):
+                best = text
+        
+        if not best.strip():
+            raise ValueError("No text could be extracted from PDF")
+        return best
+    
+    def _try_pymupdf(self, source: FileSource) -> str:
+        """Fast path: C-backed PyMuPDF text layer"""
+        if not PYMUPDF_AVAILABLE:
+            return ""
+        try:
+            with _open_pymupdf(source) as doc:
+                return "\n".join(page.get_text("text") for page in doc)
+        except Exception:
+            return ""
+    
+    def _try_pypdf2(self, source: FileSource) -> str:
+        """Pure-Python PyPDF2 text layer"""
+        try:
+            import PyPDF2
+        except ImportError:
+            return ""
+        try:
+            pdf_reader = PyPDF2.PdfReader(_as_file(source))
+            return "\n".join(page.extract_text() or "" for page in pdf_reader.pages)
+        except Exception:
+            return ""
+    
+    def _try_pdfplumber(self, source: FileSource) -> str:
+        """pdfplumber layout analysis, better on table-heavy resumes (optional)"""
+        try:
+            import pdfplumber
+        except ImportError:
+            return ""
+        try:
+            with pdfplumber.open(_as_file(source)) as pdf:
+                return "\n".join(page.extract_text() or "" for page in pdf.pages)
+        except Exception:
+            return ""
+    
+    def _try_ocr(self, source: FileSource) -> str:
+        """OCR scanned PDFs with Tesseract (optional, slowest)"""
+        if not PYMUPDF_AVAILABLE:
+            return ""
+        try:
+            import pytesseract
+            from PIL import Image
+        except ImportError:
+            return ""
+        try:
+            # Rasterize serially (a Document is not thread-safe), OCR pages in parallel
+            with _open_pymupdf(source) as doc:
+                images = [
+                    Image.open(io.BytesIO(page.get_pixmap(dpi=PDF_OCR_DPI).tobytes("png")))
+                    for page in islice(doc, PDF_OCR_MAX_PAGES)
+                ]
+            with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+                return "\n".join(executor.map(pytesseract.image_to_string, images))
+        except Exception:
+            return ""
+    
+    def _extract_docx_text(self, source: FileSource) -> str:
         """Extract text from DOCX"""
-        doc_file = io.BytesIO(file_content)
-        doc = Document(doc_file)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        from docx import Document
+        
+        doc = Document(_as_file(source))
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
     
-    def _extract_txt_text(self, file_content: bytes) -> str:
+    def _extract_txt_text(self, source: FileSource) -> str:
         """Extract text from plain text file"""
-        return file_content.decode('utf-8', errors='ignore')
+        if isinstance(source, str):
+            with open(source, encoding='utf-8', errors='ignore') as file:
+                return file.read()
+        return source.decode('utf-8', errors='ignore')
     
     def __call__(self, state: ResumeScreeningState) -> ResumeScreeningState:
         """Extract text from the file"""
-        if state.get("error"):
+        if state.error:
             return state
         
         try:
             # If we already have resume text, skip text extraction
-            if state.get("resume_text"):
-                return {
-                    **state,
-                    "error": None
-                }
+            if state.resume_text:
+                return replace(
+                    state,
+                    resume_text=_trim_resume(state.resume_text),
+                    error=None
+                )
             
             # If no file ID, we can't extract text
-            if not state.get("file_id"):
-                return {
-                    **state,
-                    "error": "No file ID available for text extraction"
-                }
-            
-            file_content = self._download_file(state["file_id"])
-            file_type = state["file_type"]
-            
-            if file_type == 'pdf':
-                text = self._extract_pdf_text(file_content)
+            if not state.file_id:
+                return replace(
+                    state,
+                    error="No file ID available for text extraction"
+                )
+            
+            file_type = state.file_type
+            
+            if file_type == 'gdoc':
+                # Export straight to plain text: one request, no document parsing
+                text = self._extract_txt_text(
+                    self._download_file(state.file_id, export_mime_type='text/plain')
+                )
+            elif file_type == 'pdf':
+                text = self._extract_pdf_text(self._download_file(state.file_id))
             elif file_type == 'docx':
-                text = self._extract_docx_text(file_content)
+                text = self._extract_docx_text(self._download_file(state.file_id))
             elif file_type == 'txt':
-                text = self._extract_txt_text(file_content)
+                text = self._extract_txt_text(self._download_file(state.file_id))
             else:
-                return {
-                    **state,
-                    "error": f"Unsupported file type: {file_type}"
-                }
+                return replace(
+                    state,
+                    error=f"Unsupported file type: {file_type}"
+                )
             
-            return {
-                **state,
-                "resume_text": text.strip(),
-                "error": None
-            }
+            return replace(
+                state,
+                resume_text=_trim_resume(text),
+                error=None
+            )
             
         except Exception as e:
-            return {
-                **state,
-                "error": f"Error extracting text: {str(e)}"
-            }
+            return replace(
+                state,
+                error=f"Error extracting text: {str(e)}"
+            )
 
 class ResumeScreenerNode:
-    """AI-powered resume screening analysis"""
+    """AI-powered resume screening analysis and candidate info extraction"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0.1
+    schema = CombinedAnalysis
+    
+    @property
+    def llm(self):
+        return _get_structured_llm(CombinedAnalysis, 0.1)
+    
+    def _build_messages(self, state: ResumeScreeningState) -> List[BaseMessage]:
+        """Build the screening prompt for one resume/job description pair"""
+        system_prompt = """You are an expert technical recruiter specializing in AI, automation, and software roles. 
+        Analyze the candidate's resume against the job description and provide a detailed screening report.
+        
+        Focus on:
+        - Technical skill alignment
+        - Experience relevance
+        - Cultural fit indicators
+        - Growth potential
+        
+        Be specific and reference actual content from both resume and job description.
+        
+        Also extract the candidate's first name, last name and email address from the resume."""
+        
+        user_prompt = f"""Job Description:
+        {state.job_description}
+        
+        Candidate Resume:
+        {state.resume_text}"""
+        
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+    
+    def _apply(self, state: ResumeScreeningState, analysis: CombinedAnalysis) -> ResumeScreeningState:
+        """Split the combined analysis back into the state fields"""
+        return replace(
+            state,
+            screening_results=analysis.model_dump(include=set(ScreeningResults.model_fields)),
+            candidate_info=analysis.model_dump(include=set(CandidateInfo.model_fields)),
+            error=None
         )
     
     def __call__(self, state: ResumeScreeningState) -> ResumeScreeningState:
-        """Analyze resume against job description"""
-        if state.get("error"):
+        """Analyze resume against job description and extract candidate info"""
+        if state.error:
             return state
         
         try:
-            system_prompt = """You are an expert technical recruiter specializing in AI, automation, and software roles. 
-            Analyze the candidate's resume against the job description and provide a detailed screening report.
-            
-            Focus on:
-            - Technical skill alignment
-            - Experience relevance
-            - Cultural fit indicators
-            - Growth potential
-            
-            Be specific and reference actual content from both resume and job description."""
-            
-            user_prompt = f"""Job Description:
-            {state['job_description']}
-            
-            Candidate Resume:
-            {state['resume_text']}
-            
-            Provide your analysis in the following JSON format:
-            {{
-                "candidate_strengths": ["strength1", "strength2"],
-                "candidate_weaknesses": ["weakness1", "weakness2"],
-                "risk_factor": {{
-                    "score": "Low/Medium/High",
-                    "explanation": "Risk explanation"
-                }},
-                "reward_factor": {{
-                    "score": "Low/Medium/High", 
-                    "explanation": "Reward explanation"
-                }},
-                "overall_fit_rating": 7,
-                "justification_for_rating": "Detailed justification"
-            }}"""
-            
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = self.llm.invoke(messages)
-            
-            # Parse the JSON response
-            import json
-            import re
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                results = json.loads(json_match.group())
-            else:
-                raise ValueError("Could not parse JSON response")
-            
-            return {
-                **state,
-                "screening_results": results,
-                "error": None
-            }
+            # One call covers both the screening report and the contact details,
+            # so the resume is only sent (and prefilled) once
+            analysis = _invoke_cached(self, state)
+            return self._apply(state, analysis)
             
         except Exception as e:
-            return {
-                **state,
-                "error": f"Error in resume screening: {str(e)}"
-            }
+            return replace(
+                state,
+                error=f"Error in resume screening: {str(e)}"
+            )
+    
+    def run_batch(self, states: List[ResumeScreeningState],
+                  max_concurrency: int = LLM_MAX_CONCURRENCY) -> List[ResumeScreeningState]:
+        """Screen several resumes with concurrent LLM requests"""
+        return _run_llm_batch(self, states, max_concurrency, "Error in resume screening")
 
 class InfoExtractorNode:
-    """Extract candidate contact information"""
+    """Extract candidate contact information (standalone, not in the default workflow)"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            temperature=0
+    schema = CandidateInfo
+    
+    @property
+    def llm(self):
+        return _get_structured_llm(CandidateInfo, 0)
+    
+    def _build_messages(self, state: ResumeScreeningState) -> List[BaseMessage]:
+        """Build the contact extraction prompt for one resume"""
+        system_prompt = """Extract the candidate's first name, last name and email address from the resume."""
+        
+        user_prompt = f"""Resume Text:
+        {state.resume_text}"""
+        
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+    
+    def _apply(self, state: ResumeScreeningState, info: CandidateInfo) -> ResumeScreeningState:
+        """Store the structured reply as candidate_info"""
+        return replace(
+            state,
+            candidate_info=info.model_dump(),
+            error=None
         )
     
     def __call__(self, state: ResumeScreeningState) -> ResumeScreeningState:
         """Extract candidate information from resume"""
-        if state.get("error"):
+        if state.error:
             return state
         
         try:
-            system_prompt = """Extract the candidate's contact information from the resume. 
-            Return only the requested information in JSON format."""
-            
-            user_prompt = f"""Resume Text:
-            {state['resume_text']}
-            
-            Extract the following information in JSON format:
-            {{
-                "first_name": "First Name",
-                "last_name": "Last Name", 
-                "email_address": "Email Address"
-            }}"""
-            
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = self.llm.invoke(messages)
-            
-            # Parse JSON response
-            import json
-            import re
-            
-            json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
-            if json_match:
-                candidate_info = json.loads(json_match.group())
-            else:
-                raise ValueError("Could not parse candidate info")
-            
-            return {
-                **state,
-                "candidate_info": candidate_info,
-                "error": None
-            }
+            info = _invoke_cached(self, state)
+            return self._apply(state, info)
             
         except Exception as e:
-            return {
-                **state,
-                "error": f"Error extracting candidate info: {str(e)}"
-            }
+            return replace(
+                state,
+                error=f"Error extracting candidate info: {str(e)}"
+            )
+    
+    def run_batch(self, states: List[ResumeScreeningState],
+                  max_concurrency: int = LLM_MAX_CONCURRENCY) -> List[ResumeScreeningState]:
+        """Extract candidate info for several resumes with concurrent LLM requests"""
+        return _run_llm_batch(self, states, max_concurrency, "Error extracting candidate info")
 
 class DataExporterNode:
     """Prepare data for export to spreadsheet"""
     
     def __call__(self, state: ResumeScreeningState) -> ResumeScreeningState:
         """Prepare structured data for export"""
-        if state.get("error"):
+        if state.error:
             return state
         
         try:
-            from datetime import datetime
-            
             # Prepare spreadsheet data
             spreadsheet_data = {
                 "Date": datetime.now().strftime("%Y-%m-%d %I:%M %p"),
-                "Resume": state["google_drive_link"],
-                "First Name": state["candidate_info"]["first_name"],
-                "Last Name": state["candidate_info"]["last_name"],
-                "Email": state["candidate_info"]["email_address"],
-                "Strengths": "\n\n".join(state["screening_results"]["candidate_strengths"]),
-                "Weaknesses": "\n\n".join(state["screening_results"]["candidate_weaknesses"]),
-                "Risk Factor": f"{state['screening_results']['risk_factor']['score']}\n\n{state['screening_results']['risk_factor']['explanation']}",
-                "Reward Factor": f"{state['screening_results']['reward_factor']['score']}\n\n{state['screening_results']['reward_factor']['explanation']}",
-                "Justification": state["screening_results"]["justification_for_rating"],
-                "Overall Fit": state["screening_results"]["overall_fit_rating"]
+                "Resume": state.google_drive_link,
+                "First Name": state.candidate_info["first_name"],
+                "Last Name": state.candidate_info["last_name"],
+                "Email": state.candidate_info["email_address"],
+                "Strengths": "\n\n".join(state.screening_results["candidate_strengths"]),
+                "Weaknesses": "\n\n".join(state.screening_results["candidate_weaknesses"]),
+                "Risk Factor": f"{state.screening_results['risk_factor']['score']}\n\n{state.screening_results['risk_factor']['explanation']}",
+                "Reward Factor": f"{state.screening_results['reward_factor']['score']}\n\n{state.screening_results['reward_factor']['explanation']}",
+                "Justification": state.screening_results["justification_for_rating"],
+                "Overall Fit": state.screening_results["overall_fit_rating"]
             }
             
-            return {
-                **state,
-                "spreadsheet_data": spreadsheet_data,
-                "error": None
-            }
+            return replace(
+                state,
+                spreadsheet_data=spreadsheet_data,
+                error=None
+            )
             
         except Exception as e:
-            return {
-                **state,
-                "error": f"Error preparing export data: {str(e)}"
-            }
+            return replace(
+                state,
+                error=f"Error preparing export data: {str(e)}"
+            )
 
 def create_workflow():
     """Create the LangGraph workflow"""
@@ -463,18 +781,37 @@ def create_workflow():
     workflow.add_node("process_file", FileProcessorNode())
     workflow.add_node("extract_text", TextExtractorNode())
     workflow.add_node("screen_resume", ResumeScreenerNode())
-    workflow.add_node("extract_info", InfoExtractorNode())
     workflow.add_node("prepare_export", DataExporterNode())
     
     # Add edges
     workflow.set_entry_point("process_file")
     workflow.add_edge("process_file", "extract_text")
     workflow.add_edge("extract_text", "screen_resume")
-    workflow.add_edge("screen_resume", "extract_info")
-    workflow.add_edge("extract_info", "prepare_export")
+    workflow.add_edge("screen_resume", "prepare_export")
     workflow.add_edge("prepare_export", END)
     
     return workflow.compile()
 
+def screen_many(resumes: List[str], job_description: str,
+                max_workers: int = IO_MAX_WORKERS,
+                max_concurrency: int = LLM_MAX_CONCURRENCY) -> List[ResumeScreeningState]:
+    """Screen several Google Drive resumes against one job description, in input order"""
+    file_processor = FileProcessorNode()
+    text_extractor = TextExtractorNode()
+    
+    def prepare(google_drive_link: str) -> ResumeScreeningState:
+        return text_extractor(file_processor(
+            ResumeScreeningState(google_drive_link=google_drive_link, job_description=job_description)
+        ))
+    
+    # Downloads and parsing are I/O bound; the LLM calls then go out as one batch
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        states = list(executor.map(prepare, resumes))
+    
+    states = ResumeScreenerNode().run_batch(states, max_concurrency=max_concurrency)
+    
+    exporter = DataExporterNode()
+    return [exporter(state) for state in states]
+
 # Create the workflow instance
 resume_screening_workflow = create_workflow() 
\ No newline at end of file
@@ -3,22 +3,25 @@ Test script for the Resume Screening System
 Tests individual components without requiring full setup
 """
 
+import io
 import os
+import sys
 import json
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, Any
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
-from resume_screener import (
-    ResumeScreeningState, 
-    FileProcessorNode, 
-    TextExtractorNode,
-    ResumeScreenerNode,
-    InfoExtractorNode,
-    DataExporterNode
-)
+# Tests tagged requires_llm are skipped without a key instead of failing on 401s
+HAS_KEY = bool(os.getenv("OPENAI_API_KEY"))
+
+# resume_screener pulls in LangGraph, OpenAI and Google clients, so the tests import it lazily
 
 # Sample test data
 SAMPLE_RESUME_TEXT = """
@@ -74,236 +77,416 @@ Responsibilities:
 - Stay current with AI/ML trends and technologies
 """
 
+# Mock analysis output for the exporter test (DataExporterNode only reads it, so it is shared as-is)
+_MOCK_SCREENING_RESULTS = {
+    "candidate_strengths": ["Python experience", "Cloud platforms"],
+    "candidate_weaknesses": ["Limited LangChain experience"],
+    "risk_factor": {"score": "Low", "explanation": "Good technical background"},
+    "reward_factor": {"score": "High", "explanation": "Strong potential"},
+    "overall_fit_rating": 8,
+    "justification_for_rating": "Strong technical skills with room for growth"
+}
+
+_MOCK_CANDIDATE_INFO = {
+    "first_name": "John",
+    "last_name": "Smith",
+    "email_address": "john.smith@email.com"
+}
+
+@lru_cache(maxsize=None)
+def _base_test_state():
+    """Every test starts from the same already-extracted resume, so LLM cache keys match across tests"""
+    from resume_screener import ResumeScreeningState
+    
+    return ResumeScreeningState(
+        google_drive_link="https://drive.google.com/test",
+        job_description=SAMPLE_JOB_DESCRIPTION,
+        file_id="test_id",
+        file_name="test_resume.pdf",
+        file_type="pdf",
+        resume_text=SAMPLE_RESUME_TEXT
+    )
+
+# Tests run concurrently; each one writes to its own buffer, flushed in one piece when it finishes
+_OUTPUT = threading.local()
+
+def _print(*args, **kwargs):
+    """Print into the running test's buffer (or stdout outside a test)"""
+    print(*args, file=getattr(_OUTPUT, "buffer", sys.stdout), **kwargs)
+
+@contextmanager
+def _status_buffer():
+    """Collect this thread's test output in a StringIO"""
+    _OUTPUT.buffer = io.StringIO()
+    try:
+        yield _OUTPUT.buffer
+    finally:
+        del _OUTPUT.buffer
+
+def _run_test(test_func):
+    """Run one test with buffered output; returns (passed, output)"""
+    with _status_buffer() as buffer:
+        try:
+            passed = test_func()
+        except Exception as e:
+            _print(f"❌ ERROR: {str(e)}")
+            passed = False
+        return passed, buffer.getvalue()
+
+# Node results shared between tests, keyed by node class; FULL_INTEGRATION=1 forces fresh calls
+_TEST_RESULTS: Dict[type, Any] = {}
+_TEST_RESULTS_LOCK = threading.Lock()
+
+def _run_screener(fresh: bool = False):
+    """Screen the base test state once and hand the same result to every test that needs it"""
+    from resume_screener import ResumeScreenerNode
+    
+    if fresh:
+        return ResumeScreenerNode()(_base_test_state())
+    with _TEST_RESULTS_LOCK:
+        if ResumeScreenerNode not in _TEST_RESULTS:
+            _TEST_RESULTS[ResumeScreenerNode] = ResumeScreenerNode()(_base_test_state())
+        return _TEST_RESULTS[ResumeScreenerNode]
+
 def test_resume_screener_node():
     """Test the AI resume screening component"""
-    print("🧪 Testing ResumeScreenerNode...")
+    _print("🧪 Testing ResumeScreenerNode...")
     
     try:
-        screener = ResumeScreenerNode()
-        
-        # Create test state
-        test_state = ResumeScreeningState(
-            google_drive_link="test_link",
-            job_description=SAMPLE_JOB_DESCRIPTION,
-            file_id="test_id",
-            file_name="test_resume.pdf",
-            file_type="pdf",
-            resume_text=SAMPLE_RESUME_TEXT,
-            screening_results=None,
-            candidate_info=None,
-            spreadsheet_data=None,
-            error=None
-        )
-        
         # Run screening
-        result = screener(test_state)
+        result = _run_screener()
         
-        if result.get("error"):
-            print(f"❌ Error: {result['error']}")
+        if result.error:
+            _print(f"❌ Error: {result.error}")
+            return False
+        
+        if result.screening_results:
+            _print("✅ Resume screening completed successfully!")
+            _print(f"   Overall Fit Rating: {result.screening_results['overall_fit_rating']}/10")
+            _print(f"   Risk Factor: {result.screening_results['risk_factor']['score']}")
+            _print(f"   Reward Factor: {result.screening_results['reward_factor']['score']}")
+        else:
+            _print("❌ No screening results generated")
             return False
         
-        if result.get("screening_results"):
-            print("✅ Resume screening completed successfully!")
-            print(f"   Overall Fit Rating: {result['screening_results']['overall_fit_rating']}/10")
-            print(f"   Risk Factor: {result['screening_results']['risk_factor']['score']}")
-            print(f"   Reward Factor: {result['screening_results']['reward_factor']['score']}")
+        if result.candidate_info and result.candidate_info.get("email_address"):
+            _print(f"   Email: {result.candidate_info['email_address']}")
             return True
         else:
-            print("❌ No screening results generated")
+            _print("❌ No candidate info returned by the screening call")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing ResumeScreenerNode: {str(e)}")
+        _print(f"❌ Error testing ResumeScreenerNode: {str(e)}")
         return False
 
 def test_info_extractor_node():
     """Test the candidate information extraction component"""
-    print("🧪 Testing InfoExtractorNode...")
+    _print("🧪 Testing InfoExtractorNode...")
     
     try:
+        from resume_screener import InfoExtractorNode
+        
         extractor = InfoExtractorNode()
         
-        # Create test state
-        test_state = ResumeScreeningState(
-            google_drive_link="test_link",
-            job_description=SAMPLE_JOB_DESCRIPTION,
-            file_id="test_id",
-            file_name="test_resume.pdf",
-            file_type="pdf",
-            resume_text=SAMPLE_RESUME_TEXT,
-            screening_results=None,
-            candidate_info=None,
-            spreadsheet_data=None,
-            error=None
-        )
+        test_state = _base_test_state()
         
         # Run extraction
         result = extractor(test_state)
         
-        if result.get("error"):
-            print(f"❌ Error: {result['error']}")
+        if result.error:
+            _print(f"❌ Error: {result.error}")
             return False
         
-        if result.get("candidate_info"):
-            info = result["candidate_info"]
-            print("✅ Candidate info extraction completed successfully!")
-            print(f"   Name: {info['first_name']} {info['last_name']}")
-            print(f"   Email: {info['email_address']}")
+        if result.candidate_info:
+            info = result.candidate_info
+            _print("✅ Candidate info extraction completed successfully!")
+            _print(f"   Name: {info['first_name']} {info['last_name']}")
+            _print(f"   Email: {info['email_address']}")
             return True
         else:
-            print("❌ No candidate info extracted")
+            _print("❌ No candidate info extracted")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing InfoExtractorNode: {str(e)}")
+        _print(f"❌ Error testing InfoExtractorNode: {str(e)}")
         return False
 
 def test_data_exporter_node():
     """Test the data export preparation component"""
-    print("🧪 Testing DataExporterNode...")
+    _print("🧪 Testing DataExporterNode...")
     
     try:
+        from resume_screener import DataExporterNode
+        
         exporter = DataExporterNode()
         
-        # Create test state with mock data
-        test_state = ResumeScreeningState(
-            google_drive_link="https://drive.google.com/test",
-            job_description=SAMPLE_JOB_DESCRIPTION,
-            file_id="test_id",
-            file_name="test_resume.pdf",
-            file_type="pdf",
-            resume_text=SAMPLE_RESUME_TEXT,
-            screening_results={
-                "candidate_strengths": ["Python experience", "Cloud platforms"],
-                "candidate_weaknesses": ["Limited LangChain experience"],
-                "risk_factor": {"score": "Low", "explanation": "Good technical background"},
-                "reward_factor": {"score": "High", "explanation": "Strong potential"},
-                "overall_fit_rating": 8,
-                "justification_for_rating": "Strong technical skills with room for growth"
-            },
-            candidate_info={
-                "first_name": "John",
-                "last_name": "Smith",
-                "email_address": "john.smith@email.com"
-            },
-            spreadsheet_data=None,
-            error=None
+        test_state = dataclasses.replace(
+            _base_test_state(),
+            screening_results=_MOCK_SCREENING_RESULTS,
+            candidate_info=_MOCK_CANDIDATE_INFO
         )
         
         # Run export preparation
         result = exporter(test_state)
         
-        if result.get("error"):
-            print(f"❌ Error: {result['error']}")
+        if result.error:
+            _print(f"❌ Error: {result.error}")
             return False
         
-        if result.get("spreadsheet_data"):
-            data = result["spreadsheet_data"]
-            print("✅ Data export preparation completed successfully!")
-            print(f"   Fields prepared: {len(data)}")
-            print(f"   Overall Fit: {data['Overall Fit']}")
+        if result.spreadsheet_data:
+            data = result.spreadsheet_data
+            _print("✅ Data export preparation completed successfully!")
+            _print(f"   Fields prepared: {len(data)}")
+            _print(f"   Overall Fit: {data['Overall Fit']}")
             return True
         else:
-            print("❌ No spreadsheet data prepared")
+            _print("❌ No spreadsheet data prepared")
             return False
             
     except Exception as e:
-        print(f"❌ Error testing DataExporterNode: {str(e)}")
+        _print(f"❌ Error testing DataExporterNode: {str(e)}")
         return False
 
 def test_workflow_integration():
     """Test the complete workflow with mock data"""
-    print("🧪 Testing complete workflow integration...")
+    _print("🧪 Testing complete workflow integration...")
     
     try:
-        from resume_screener import resume_screening_workflow
-        
-        # Create initial state with mock data
-        initial_state = ResumeScreeningState(
-            google_drive_link="https://drive.google.com/test",
-            job_description=SAMPLE_JOB_DESCRIPTION,
-            file_id="test_id",
-            file_name="test_resume.pdf",
-            file_type="pdf",
-            resume_text=SAMPLE_RESUME_TEXT,
-            screening_results=None,
-            candidate_info=None,
-            spreadsheet_data=None,
-            error=None
-        )
+        from resume_screener import DataExporterNode
         
         # Skip file processing nodes and start with text extraction
-        # This simulates the workflow after file processing
-        workflow_state = initial_state.copy()
-        
-        # Run the AI analysis nodes
-        screener = ResumeScreenerNode()
-        workflow_state = screener(workflow_state)
+        # This simulates the workflow after file processing;
+        # the AI analysis (screening and candidate info in one call) is shared with the unit test
+        workflow_state = _run_screener(fresh=bool(os.getenv("FULL_INTEGRATION")))
         
-        if workflow_state.get("error"):
-            print(f"❌ Screening error: {workflow_state['error']}")
+        if workflow_state.error:
+            _print(f"❌ Screening error: {workflow_state.error}")
             return False
         
-        extractor = InfoExtractorNode()
-        workflow_state = extractor(workflow_state)
-        
-        if workflow_state.get("error"):
-            print(f"❌ Info extraction error: {workflow_state['error']}")
+        if not workflow_state.candidate_info:
+            _print("❌ Screener did not fill candidate_info")
             return False
         
         exporter = DataExporterNode()
         workflow_state = exporter(workflow_state)
         
-        if workflow_state.get("error"):
-            print(f"❌ Export error: {workflow_state['error']}")
+        if workflow_state.error:
+            _print(f"❌ Export error: {workflow_state.error}")
+            return False
+        
+        # Nodes return new states via replace(); the shared input must come back untouched
+        base_state = _base_test_state()
+        if workflow_state is base_state or any(
+            getattr(base_state, field) is not None
+            for field in ("screening_results", "candidate_info", "spreadsheet_data")
+        ):
+            _print("❌ A node mutated its input state")
+            return False
+        
+        _print("✅ Complete workflow integration test passed!")
+        _print(f"   Final state keys: {[f.name for f in dataclasses.fields(workflow_state)]}")
+        return True
+        
+    except Exception as e:
+        _print(f"❌ Error testing workflow integration: {str(e)}")
+        return False
+
+def test_resume_trimming():
+    """Test whitespace normalization and section trimming of long resumes"""
+    _print("🧪 Testing resume trimming...")
+    
+    try:
+        from resume_screener import _trim_resume, RESUME_MAX_CHARS
+        
+        if _trim_resume("John   Smith\n\n\n  Engineer  ") != "John Smith\nEngineer":
+            _print("❌ Whitespace was not normalized")
+            return False
+        
+        if _trim_resume(SAMPLE_RESUME_TEXT) != _trim_resume(_trim_resume(SAMPLE_RESUME_TEXT)):
+            _print("❌ Trimming a short resume twice changed it")
             return False
         
-        print("✅ Complete workflow integration test passed!")
-        print(f"   Final state keys: {list(workflow_state.keys())}")
+        # Oversized hobbies section: dropped, while the preamble and kept sections survive in order
+        long_resume = (
+            "John Smith\njohn.smith@email.com\n"
+            "EXPERIENCE\nSenior Software Engineer at TechCorp\n"
+            "HOBBIES\n" + "Chess and hiking.\n" * 500 +
+            "SKILLS\nPython, Kubernetes\n"
+        )
+        trimmed = _trim_resume(long_resume)
+        if len(trimmed) > RESUME_MAX_CHARS or "Chess" in trimmed:
+            _print("❌ Long resume was not trimmed to its relevant sections")
+            return False
+        if not (trimmed.startswith("John Smith") and trimmed.index("TechCorp") < trimmed.index("Kubernetes")):
+            _print("❌ Trimming lost the preamble or reordered sections")
+            return False
+        
+        _print("✅ Resume trimming keeps the relevant sections in order!")
+        return True
+        
+    except Exception as e:
+        _print(f"❌ Error testing resume trimming: {str(e)}")
+        return False
+
+def test_pair_validation():
+    """Test that unusable resume/JD pairs are rejected before a workflow run"""
+    _print("🧪 Testing pair validation...")
+    
+    try:
+        from unified_resume_screener import UnifiedResumeScreener, ScreeningInput
+        
+        screener = UnifiedResumeScreener(max_workers=2)
+        resume = ScreeningInput("text", SAMPLE_RESUME_TEXT, "Resume", "pasted_text")
+        job_desc = ScreeningInput("text", SAMPLE_JOB_DESCRIPTION, "JD", "pasted_text")
+        
+        if screener._validate_pair(resume, job_desc, SAMPLE_JOB_DESCRIPTION) is not None:
+            _print("❌ A valid pair was rejected")
+            return False
+        
+        invalid_pairs = {
+            "error resume": (ScreeningInput("text", "Download failed", "Resume", "error"), job_desc, SAMPLE_JOB_DESCRIPTION),
+            "empty resume": (ScreeningInput("text", "   ", "Resume", "pasted_text"), job_desc, SAMPLE_JOB_DESCRIPTION),
+            "error JD": (resume, ScreeningInput("text", "Scrape failed", "JD", "error"), None),
+            "empty JD": (resume, job_desc, "  "),
+        }
+        for label, pair in invalid_pairs.items():
+            if not screener._validate_pair(*pair):
+                _print(f"❌ Pair with {label} was not rejected")
+                return False
+        
+        _print("✅ Pair validation rejects unusable inputs!")
+        return True
+        
+    except Exception as e:
+        _print(f"❌ Error testing pair validation: {str(e)}")
+        return False
+
+def test_pair_deduplication():
+    """Test that duplicate resume/JD pairs run the workflow once and results keep matrix order"""
+    _print("🧪 Testing pair deduplication...")
+    
+    try:
+        from unified_resume_screener import UnifiedResumeScreener, ScreeningInput
+        
+        screener = UnifiedResumeScreener(max_workers=4)
+        
+        # Count workflow runs instead of calling the LLM
+        runs = []
+        runs_lock = threading.Lock()
+        
+        def fake_pair(resume, job_desc, job_description_text=None):
+            with runs_lock:
+                runs.append((resume.content, job_description_text))
+            return {"success": True, "resume_name": resume.name, "resume_source": resume.source,
+                    "jd_name": job_desc.name, "jd_source": job_desc.source,
+                    "jd_original_url": job_desc.original_url}
+        
+        screener.process_single_resume_jd_pair = fake_pair
+        
+        # Rows 1 and 3 repeat the same Drive link, and both JDs share their text
+        links = [
+            "https://drive.google.com/file/d/resume_one/view",
+            "https://drive.google.com/file/d/resume_two/view",
+            "https://drive.google.com/file/d/resume_one/view",
+        ]
+        resumes = [screener.process_resume_link(link, idx) for idx, link in enumerate(links)]
+        resumes.append(ScreeningInput("text", "", "Empty Resume", "pasted_text"))
+        job_descriptions = [
+            ScreeningInput("text", SAMPLE_JOB_DESCRIPTION, "JD A", "pasted_text"),
+            ScreeningInput("text", SAMPLE_JOB_DESCRIPTION, "JD B", "uploaded_file"),
+        ]
+        
+        results = dict(screener.iter_pair_results(resumes, job_descriptions))
+        
+        if len(runs) != 2 or len(set(runs)) != 2:
+            _print(f"❌ Expected 2 workflow runs for 2 distinct pairs, got {len(runs)}")
+            return False
+        
+        if sorted(results) != list(range(len(resumes) * len(job_descriptions))):
+            _print(f"❌ Results are missing matrix indexes: {sorted(results)}")
+            return False
+        
+        # Every matrix slot is labeled with its own resume and JD, duplicates included
+        for index, result in results.items():
+            resume = resumes[index // len(job_descriptions)]
+            job_desc = job_descriptions[index % len(job_descriptions)]
+            if (result["resume_name"], result["jd_name"]) != (resume.name, job_desc.name):
+                _print(f"❌ Result {index} is labeled {result['resume_name']} / {result['jd_name']}")
+                return False
+            if result["success"] != bool(resume.content):
+                _print(f"❌ Result {index} has the wrong outcome")
+                return False
+        
+        _print("✅ Duplicate pairs screened once; results map back in matrix order!")
+        _print(f"   Workflow runs: {len(runs)} for {len(results)} matrix cells")
         return True
         
     except Exception as e:
-        print(f"❌ Error testing workflow integration: {str(e)}")
+        _print(f"❌ Error testing pair deduplication: {str(e)}")
         return False
 
+test_resume_screener_node.requires_llm = True
+test_info_extractor_node.requires_llm = True
+test_data_exporter_node.requires_llm = False
+test_workflow_integration.requires_llm = True
+test_resume_trimming.requires_llm = False
+test_pair_validation.requires_llm = False
+test_pair_deduplication.requires_llm = False
+
+_TESTS = (
+    ("Resume Screening", test_resume_screener_node),
+    ("Info Extraction", test_info_extractor_node),
+    ("Data Export", test_data_exporter_node),
+    ("Workflow Integration", test_workflow_integration),
+    ("Resume Trimming", test_resume_trimming),
+    ("Pair Validation", test_pair_validation),
+    ("Pair Deduplication", test_pair_deduplication),
+)
+
 def main():
     """Run all tests"""
     print("🚀 Starting Resume Screening System Tests\n")
     
     # Check for OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
+    if not HAS_KEY:
         print("⚠️  Warning: OPENAI_API_KEY not found in environment variables")
-        print("   Some tests may fail. Set your OpenAI API key to run full tests.\n")
+        print("   Tests that call the OpenAI API will be skipped.\n")
     
-    tests = [
-        ("Resume Screening", test_resume_screener_node),
-        ("Info Extraction", test_info_extractor_node),
-        ("Data Export", test_data_exporter_node),
-        ("Workflow Integration", test_workflow_integration),
-    ]
+    tests = []
+    for test_name, test_func in _TESTS:
+        if test_func.requires_llm and not HAS_KEY:
+            print(f"⏭️  {test_name}: SKIPPED (no API key)")
+        else:
+            tests.append((test_name, test_func))
+    skipped = len(_TESTS) - len(tests)
+    if skipped:
+        print()
     
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        print(f"📋 {test_name} Test")
-        print("-" * 40)
-        
-        try:
-            if test_func():
+    # Tests are independent and mostly wait on the OpenAI API, so overlap them
+    with ThreadPoolExecutor(max_workers=total) as executor:
+        futures = {executor.submit(_run_test, test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            test_passed, output = future.result()
+            if test_passed:
                 passed += 1
-                print("✅ PASSED\n")
-            else:
-                print("❌ FAILED\n")
-        except Exception as e:
-            print(f"❌ ERROR: {str(e)}\n")
+            verdict = "✅ PASSED" if test_passed else "❌ FAILED"
+            sys.stdout.write(f"📋 {futures[future]} Test\n{'-' * 40}\n{output}{verdict}\n\n")
+            sys.stdout.flush()
     
     print("📊 Test Results")
     print("-" * 40)
     print(f"Passed: {passed}/{total}")
     print(f"Success Rate: {(passed/total)*100:.1f}%")
+    if skipped:
+        print(f"Skipped: {skipped} (set OPENAI_API_KEY to run them)")
     
-    if passed == total:
+    if passed == total and skipped:
+        print("\n✅ All runnable tests passed. Set OPENAI_API_KEY to run the AI tests.")
+    elif passed == total:
         print("\n🎉 All tests passed! The system is ready to use.")
     else:
         print(f"\n⚠️  {total - passed} test(s) failed. Check the errors above.")
@@ -4,20 +4,28 @@ Professional web interface for matrix-based resume screening
 """
 
 import os
-import json
+import atexit
+import shutil
+import uuid
+import sys
 import csv
 import io
 import re
 import logging
+import hashlib
 import datetime
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from html import escape as html_escape
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 import tempfile
-import requests
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import gradio as gr
-from resume_screener import resume_screening_workflow, ResumeScreeningState
 
 # Configure logging
 logging.basicConfig(
@@ -30,67 +38,356 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Try to import PDF text extraction libraries
+# Try to import PDF text extraction libraries; PyMuPDF (MuPDF, in C) is preferred
 try:
-    import PyPDF2
-    PDF_AVAILABLE = True
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Pure-Python fallback reader, resolved once: pypdf (maintained), then its predecessor PyPDF2
+try:
+    from pypdf import PdfReader
 except ImportError:
     try:
-        import pypdf
-        PDF_AVAILABLE = True
+        from PyPDF2 import PdfReader
     except ImportError:
-        PDF_AVAILABLE = False
-        logger.warning("PDF text extraction not available. Install PyPDF2 or pypdf for PDF support.")
+        PdfReader = None
+
+PDF_AVAILABLE = PYMUPDF_AVAILABLE or PdfReader is not None
+if not PDF_AVAILABLE:
+    logger.warning("PDF text extraction not available. Install pymupdf, PyPDF2 or pypdf for PDF support.")
+
+# lxml parses job pages in C; fall back to regex tag stripping without it
+try:
+    import lxml.html
+    from lxml.etree import ParserError
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+# Resume x job description pairs screened at once (each is mostly network/LLM wait)
+MATRIX_MAX_WORKERS = 16
+
+# Browser User-Agent sent to job boards and Google Docs
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Job pages fetched at once when a CSV lists several
+JD_SCRAPE_MAX_WORKERS = 8
+
+# Requests in flight to any one host (LinkedIn, Google Docs), to stay under their rate limits
+HTTP_MAX_PER_HOST = 4
+
+# Job pages are read up to this many bytes; the posting text sits well within it
+JD_MAX_HTML_BYTES = 200_000
+
+# PDF pages parsed per resume; caps the work a malformed or huge upload can cause
+PDF_MAX_PAGES = 20
+
+# Uploaded text files are read up to this many characters, far beyond any resume or posting
+TEXT_UPLOAD_MAX_CHARS = 64 * 1024
+
+# CSV export columns, in order
+CSV_FIELDS = [
+    'Resume Name', 'Resume Source', 'Job Description Name', 'Job Description Source', 'Job Description URL',
+    'Candidate First Name', 'Candidate Last Name', 'Candidate Email',
+    'Overall Fit Rating', 'Risk Score', 'Reward Score',
+    'Strengths', 'Weaknesses', 'Risk Explanation', 'Reward Explanation', 'Justification'
+]
+
+# Styles for the results cards, emitted once per table instead of inline on every card
+RESULTS_TABLE_CSS = """
+        <style>
+            .rs-card { border: 1px solid #ddd; border-radius: 8px; margin-bottom: 20px; overflow: hidden; }
+            .rs-card-head { background: #f8f9fa; padding: 15px; border-bottom: 1px solid #ddd; }
+            .rs-head-grid { display: grid; grid-template-columns: 1fr 1fr 120px; gap: 20px; align-items: center; }
+            .rs-name { color: #2c3e50; }
+            .rs-source { color: #666; }
+            .rs-rating { text-align: center; padding: 10px; border-radius: 5px; border: 2px solid; }
+            .rs-rating-value { font-size: 20px; font-weight: bold; }
+            .rs-rating-sub { font-size: 10px; color: #666; margin-top: 2px; }
+            .rs-high { color: #27ae60; background: #e8f5e8; }
+            .rs-mid { color: #f39c12; background: #fff3cd; }
+            .rs-low { color: #e74c3c; background: #ffeaea; }
+            .rs-card-body { padding: 15px; }
+            .rs-details { margin-top: 10px; }
+            .rs-details summary { cursor: pointer; color: #3498db; font-weight: bold; }
+            .rs-details summary.rs-analysis { color: #27ae60; }
+            .rs-panel { background: #f8f9fa; padding: 15px; border-radius: 5px; margin-top: 10px; }
+            .rs-text { background: white; padding: 15px; border-radius: 5px; border: 1px solid #ddd; max-height: 400px; overflow-y: auto; font-family: Arial, sans-serif; font-size: 13px; line-height: 1.5; white-space: pre-wrap; }
+            .rs-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px; }
+            .rs-box { padding: 10px; border-radius: 5px; }
+            .rs-box h4 { margin-top: 0; font-size: 14px; }
+            .rs-box ul { margin: 0; padding-left: 20px; font-size: 12px; }
+            .rs-box p { margin: 5px 0; font-size: 12px; }
+            .rs-strengths { background: #e8f5e8; } .rs-strengths h4 { color: #27ae60; }
+            .rs-weaknesses { background: #ffeaea; } .rs-weaknesses h4 { color: #e74c3c; }
+            .rs-risk { background: #fff3cd; } .rs-risk h4 { color: #856404; }
+            .rs-reward { background: #d1ecf1; } .rs-reward h4 { color: #0c5460; }
+            .rs-overall { background: #e3f2fd; } .rs-overall h4 { color: #1976d2; }
+            .rs-fit { font-size: 16px; font-weight: bold; color: #3498db; }
+            .rs-failed { border: 1px solid #e74c3c; border-radius: 8px; margin-bottom: 20px; background: #fdf2f2; }
+            .rs-failed-head { background: #e74c3c; color: white; padding: 15px; }
+            .rs-failed-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; align-items: center; }
+            .rs-failed-body { padding: 15px; color: #e74c3c; }
+        </style>
+"""
+
+# slots=True needs Python 3.10+; fall back to a regular dataclass on 3.9
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ScreeningInput:
+    """One extracted resume or job description"""
+    type: str  # "text", "file" or "google_drive"
+    content: str
+    name: str
+    source: str
+    original_url: str = ""
+
+# Fixed pieces of the results table
+_TABLE_HEAD = RESULTS_TABLE_CSS + """
+        <div style="font-family: Arial, sans-serif; max-width: 1200px; margin: 0 auto;">
+            <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
+                Resume Screening Results
+            </h2>
+            """
+_NO_RESULTS_HTML = "<p>No results to display.</p>"
+_TABLE_FOOT = """
+            </div>
+        </div>
+        """
+
+# Status banners for the Gradio results panel; {items} / {error} are filled in per call
+_INPUT_MISSING_HTML = """
+    <div style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 8px; padding: 20px; margin: 10px 0;">
+        <h3 style="color: #856404; margin-top: 0;">⚠️ Please Complete Your Input</h3>
+        <p style="color: #856404; margin-bottom: 15px;">To start the analysis, please provide:</p>
+        <ul style="color: #856404; margin: 0; padding-left: 20px;">
+            {items}
+        </ul>
+    </div>
+    """
+_NO_RESUMES_HTML = """
+    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
+        <h3 style="color: #721c24; margin-top: 0;">📄 No Valid Resumes Found</h3>
+        <p style="color: #721c24; margin-bottom: 10px;">Please check your resume input:</p>
+        <ul style="color: #721c24; margin: 0; padding-left: 20px;">
+            <li>Make sure the file is uploaded correctly</li>
+            <li>Ensure the Google Doc is shared with "Anyone with the link can view"</li>
+            <li>Check that the CSV file contains valid links</li>
+            <li>Verify that pasted text is not empty</li>
+        </ul>
+    </div>
+    """
+_NO_JOB_DESCRIPTIONS_HTML = """
+    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
+        <h3 style="color: #721c24; margin-top: 0;">💼 No Valid Job Descriptions Found</h3>
+        <p style="color: #721c24; margin-bottom: 10px;">Please check your job description input:</p>
+        <ul style="color: #721c24; margin: 0; padding-left: 20px;">
+            <li>Make sure the file is uploaded correctly</li>
+            <li>Ensure the job posting URL is accessible</li>
+            <li>Check that the CSV file contains valid links</li>
+            <li>Verify that pasted text is not empty</li>
+        </ul>
+    </div>
+    """
+_ANALYSIS_FAILED_HTML = """
+    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
+        <h3 style="color: #721c24; margin-top: 0;">❌ Analysis Failed</h3>
+        <p style="color: #721c24; margin-bottom: 10px;">An unexpected error occurred during processing:</p>
+        <div style="background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 4px; padding: 10px; margin: 10px 0;">
+            <code style="color: #721c24;">{error}</code>
+        </div>
+        <p style="color: #721c24; margin: 0; font-size: 14px;">
+            Please check your inputs and try again. If the problem persists, try using different input methods.
+        </p>
+    </div>
+    """
+
+# Rating badge class by fit score 0-10: red below 6, orange for 6-7, green from 8
+_RATING_CLASSES = ("rs-low",) * 6 + ("rs-mid",) * 2 + ("rs-high",) * 3
+
+# In-session memo sizes for scraped job pages / Google Docs and finished workflow runs
+SCRAPE_CACHE_SIZE = 128
+WORKFLOW_CACHE_SIZE = 256
+
+# Job title extraction patterns, compiled once. Title patterns are tried in
+# priority order, so they stay separate rather than one alternation.
+_HTML_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_META_DESCRIPTION_RE = re.compile(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', re.IGNORECASE)
+_TITLE_SITE_SUFFIX_RE = re.compile(r'\s*-\s*(?:LinkedIn|Job Search|Jobs)', re.IGNORECASE)
+_META_TITLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:hiring|seeking|looking for)\s+([^.!?]+)',
+    r'(?:position|role|job)\s+(?:of|as)\s+([^.!?]+)',
+    r'([^.!?]*\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Director|Lead|Senior|Junior)[^.!?]*)'
+))
+_TEXT_TITLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:hiring|seeking|looking for)\s+([^.!?]+)',
+    r'(?:position|role|job)\s+(?:of|as)\s+([^.!?]+)',
+    r'([^.!?]*\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Director|Lead|Senior|Junior|Architect|Consultant|Advisor)[^.!?]*)',
+    r'([^.!?]*\s+(?:Software|Data|Product|Project|Business|Marketing|Sales|HR|Finance|Operations)[^.!?]*)'
+))
+
+# Page cleanup patterns for scraped job descriptions, compiled once
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SCRIPT_BLOCK_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL)
+_JS_FUNCTION_RE = re.compile(r'function\s+\w+\s*\([^)]*\)\s*\{[^}]*\}')
+
+def _fuse_patterns(*patterns: "re.Pattern") -> "re.Pattern":
+    """One alternation of several patterns, so the text is scanned once instead of once per pattern"""
+    return re.compile('|'.join(
+        f"(?s:{p.pattern})" if p.flags & re.DOTALL else f"(?:{p.pattern})" for p in patterns
+    ))
+
+_JS_SNIPPET_RE = _fuse_patterns(
+    _JS_FUNCTION_RE,
+    re.compile(r'window\.\w+\s*=\s*\w+\(\);'),
+    re.compile(r'p\.resolve\s*=\s*\w+;'),
+    re.compile(r'p\.reject\s*=\s*\w+;'),
+)
+# Sentences of a scraped page kept as the job description (plain substring match, any case)
+_JOB_KEYWORD_RE = re.compile(
+    r'hiring|job|position|role|responsibilities|requirements|qualifications|experience|skills', re.IGNORECASE
+)
+_UNREADABLE_CHARS_RE = re.compile(r'[^\w\s\.\,\-\!\?\:\;\(\)\[\]\@\#]')
+_GOOGLE_DOC_ID_RE = re.compile(r'/document/d/([a-zA-Z0-9-_]+)')
+# Common LinkedIn UI text
+_LINKEDIN_NOISE_RE = _fuse_patterns(
+    re.compile(r'Skip to main content'),
+    re.compile(r'Expand search.*?current selection\.', re.DOTALL),
+    re.compile(r'Jobs People Learning'),
+    re.compile(r'Clear text'),
+    re.compile(r'Join now Sign in'),
+    re.compile(r'Apply Join or sign in to find your next job'),
+    re.compile(r'Join to apply for.*?role at'),
+    re.compile(r'Not you\?'),
+    re.compile(r'Remove photo'),
+    re.compile(r'First name Last name Email Password.*?Cookie Policy', re.DOTALL),
+    re.compile(r'Continue Agree & Join'),
+    re.compile(r'You may also apply directly on company website'),
+    re.compile(r'Security verification'),
+    re.compile(r'Already on LinkedIn\? Sign in'),
+    re.compile(r'\d+ hours ago'),
+    re.compile(r'Over \d+ applicants'),
+    re.compile(r'See who.*?hired for'),
+)
+
+# Card text cleanup is memoized: each resume and JD appears in a whole row/column of the matrix
+@lru_cache(maxsize=256)
+def _display_resume_text(resume_content: str) -> str:
+    """Resume text as shown in a results card, HTML-escaped"""
+    # Format the content for display: remove extra whitespace
+    resume_content = ' '.join(resume_content.split())
+    # Limit length for display
+    if len(resume_content) > 2000:
+        resume_content = resume_content[:2000] + "... [Content truncated for display]"
+    return html_escape(resume_content)
+
+@lru_cache(maxsize=256)
+def _display_jd_text(jd_content: str) -> str:
+    """Job description text as shown in a results card, HTML-escaped"""
+    # Remove HTML tags
+    jd_content = _HTML_TAG_RE.sub(' ', jd_content)
+    # Remove JavaScript
+    jd_content = _SCRIPT_BLOCK_RE.sub(' ', jd_content)
+    jd_content = _JS_FUNCTION_RE.sub(' ', jd_content)
+    # Remove extra whitespace
+    jd_content = ' '.join(jd_content.split())
+    # Limit length for display
+    if len(jd_content) > 2000:
+        jd_content = jd_content[:2000] + "... [Content truncated for display]"
+    return html_escape(jd_content)
+
 class UnifiedResumeScreener:
     """Unified resume screening system with matrix processing"""
     
-    def __init__(self):
-        pass
+    def __init__(self, max_workers: int = MATRIX_MAX_WORKERS):
+        self.max_workers = max_workers
+        # URL -> (text, job title), Google Doc URL -> text and content hash -> workflow result,
+        # shared by worker threads
+        self._scrape_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._doc_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._workflow_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._http = None
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        # CSV downloads go into one private directory, removed when the app exits
+        self.workdir = tempfile.mkdtemp(prefix="screener_")
+        atexit.register(shutil.rmtree, self.workdir, ignore_errors=True)
     
-    def extract_pdf_text(self, pdf_content: str) -> str:
-        """Extract text from PDF content"""
+    def _get_http_session(self):
+        """Shared keep-alive HTTP session with retries, created on first use"""
+        with self._cache_lock:
+            if self._http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                session.headers['User-Agent'] = HTTP_USER_AGENT
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=max(self.max_workers, JD_SCRAPE_MAX_WORKERS),
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._http = session
+            return self._http
+    
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore capping concurrent requests to the URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self._cache_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(HTTP_MAX_PER_HOST)
+            return self._host_slots[host]
+    
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Look up a memoized value, marking it recently used"""
+        with self._cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        return None
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value, max_size: int) -> None:
+        """Memoize a value, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    def extract_pdf_text(self, pdf_content: bytes, max_pages: int = PDF_MAX_PAGES) -> str:
+        """Extract text from the first max_pages pages of PDF content; raises ValueError if there is none"""
+        # Failures raise rather than return a message, so the message is never screened as a resume
         if not PDF_AVAILABLE:
-            return "PDF text extraction not available. Please install PyPDF2 or pypdf."
+            raise ValueError("PDF text extraction not available. Please install pymupdf, PyPDF2 or pypdf.")
         
         try:
-            # Create a temporary file to work with the PDF content
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(pdf_content.encode('latin-1'))  # PDF content is binary
-                tmp_file_path = tmp_file.name
-            
-            # Extract text from PDF
-            try:
-                import PyPDF2
-                with open(tmp_file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-            except ImportError:
-                import pypdf
-                with open(tmp_file_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-            
-            # Clean up temporary file
-            os.unlink(tmp_file_path)
+            # Parse in memory; no temporary file needed
+            if PYMUPDF_AVAILABLE:
+                with pymupdf.open(stream=pdf_content, filetype="pdf") as doc:
+                    text = "\n".join(page.get_text("text") for page in islice(doc, max_pages))
+            else:
+                pdf_reader = PdfReader(io.BytesIO(pdf_content))
+                text = "\n".join(page.extract_text() or "" for page in islice(pdf_reader.pages, max_pages))
             
             # Clean up the extracted text
-            text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-            text = text.strip()
-            
-            return text if text else "No text could be extracted from PDF"
-            
+            text = ' '.join(text.split())  # Normalize whitespace
         except Exception as e:
             logger.error(f"PDF extraction error: {str(e)}")
-            return f"Error extracting PDF text: {str(e)}"
+            raise ValueError(f"Error extracting PDF text: {str(e)}") from e
+        
+        if not text:
+            raise ValueError("No text could be extracted from PDF")
+        return text
     
     def _is_direct_text(self, link_str: str) -> bool:
         """Check if the link is direct text content (not a file path or URL)"""
@@ -115,31 +412,24 @@ class UnifiedResumeScreener:
                 # Read PDF as binary and extract text
                 with open(file_path, 'rb') as f:
                     pdf_content = f.read()
-                return self.extract_pdf_text(pdf_content.decode('latin-1'))
+                return self.extract_pdf_text(pdf_content)
             else:
                 # Read as text file
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.read()
+                    return f.read(TEXT_UPLOAD_MAX_CHARS)
         except Exception as e:
             raise Exception(f"Error reading file {file_path}: {str(e)}")
     
-    def _create_result_dict(self, content: str, name: str, source: str, item_type: str = "text", original_url: str = None) -> Dict[str, str]:
-        """Create a standardized result dictionary"""
-        result = {
-            "type": item_type,
-            "content": content,
-            "name": name,
-            "source": source
-        }
-        if original_url:
-            result["original_url"] = original_url
-        return result
+    def _create_result_dict(self, content: str, name: str, source: str, item_type: str = "text", original_url: str = None) -> ScreeningInput:
+        """Create a standardized extracted input"""
+        return ScreeningInput(item_type, content, name, source, original_url or "")
     
-    def _create_error_result(self, error_msg: str, name: str) -> Dict[str, str]:
-        """Create a standardized error result dictionary"""
+    def _create_error_result(self, error_msg: str, name: str) -> ScreeningInput:
+        """Create a standardized error input"""
         return self._create_result_dict(error_msg, name, "error")
     
-    def process_resume_link(self, link: str, index: int = None) -> Dict[str, str]:
+    def process_resume_link(self, link: str, index: int = None,
+                            prefetched: Dict[str, Any] = None) -> ScreeningInput:
         """
         Unified resume link processing function that handles any type of link or content.
         
@@ -152,6 +442,7 @@ class UnifiedResumeScreener:
         Args:
             link: The link or content to process
             index: Optional index for CSV items
+            prefetched: Optional {url: document text} from _prefetch_google_docs
             
         Returns:
             Dict with processed content and metadata
@@ -201,12 +492,12 @@ class UnifiedResumeScreener:
         
         # 3. Google Doc link (PDF download)
         if self._is_google_doc(link_str):
-            doc_id_match = re.search(r'/document/d/([a-zA-Z0-9-_]+)', link_str)
+            doc_id_match = _GOOGLE_DOC_ID_RE.search(link_str)
             doc_id = doc_id_match.group(1) if doc_id_match else "unknown"
             display_name = f"Google Doc ({doc_id[:8]}...)"
             try:
                 logger.info(f"Processing Google Doc: {link_str}")
-                content = self.download_google_doc_as_pdf(link_str)
+                content = self._from_prefetch(prefetched, self.download_google_doc_as_pdf, link_str)
                 return self._create_result_dict(
                     content,
                     display_name,
@@ -248,7 +539,8 @@ class UnifiedResumeScreener:
             "unknown"
         )
 
-    def process_job_description_link(self, link: str, index: int = None) -> Dict[str, str]:
+    def process_job_description_link(self, link: str, index: int = None,
+                                     prefetched: Dict[str, Any] = None) -> ScreeningInput:
         """
         Unified job description link processing function.
         
@@ -260,6 +552,7 @@ class UnifiedResumeScreener:
         Args:
             link: The link or content to process
             index: Optional index for CSV items
+            prefetched: Optional {url: scrape result} from _prefetch_job_pages
             
         Returns:
             Dict with processed content and metadata
@@ -334,7 +627,7 @@ class UnifiedResumeScreener:
             
             try:
                 logger.info(f"Scraping job description from URL: {link_str}")
-                content, job_title = self.scrape_job_description(link_str)
+                content, job_title = self._from_prefetch(prefetched, self.scrape_job_description, link_str)
                 
                 # Use extracted job title if available, otherwise fall back to domain-based name
                 if job_title:
@@ -371,7 +664,7 @@ class UnifiedResumeScreener:
         )
 
     def extract_resumes(self, resume_input_type: str, resume_file=None, resume_text="", 
-                       resume_link="", resume_csv=None) -> List[Dict[str, str]]:
+                       resume_link="", resume_csv=None) -> List[ScreeningInput]:
         """Extract resumes based on input type"""
         resumes = []
         
@@ -387,24 +680,24 @@ class UnifiedResumeScreener:
                         # Read PDF as binary and extract text
                         with open(file_path, 'rb') as f:
                             pdf_content = f.read()
-                        extracted_text = self.extract_pdf_text(pdf_content.decode('latin-1'))
-                        resumes.append({
-                            "type": "file",
-                            "content": extracted_text,  # Store extracted text
-                            "name": basename,
-                            "source": "uploaded_file"
-                        })
+                        extracted_text = self.extract_pdf_text(pdf_content)
+                        resumes.append(ScreeningInput(
+                            type="file",
+                            content=extracted_text,  # Store extracted text
+                            name=basename,
+                            source="uploaded_file"
+                        ))
                         logger.info(f"Extracted PDF text: {extracted_text[:100]}...")
                     else:
                         # For text files, read as text
                         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            file_content = f.read()
-                        resumes.append({
-                            "type": "file",
-                            "content": file_content,
-                            "name": basename,
-                            "source": "uploaded_file"
-                        })
+                            file_content = f.read(TEXT_UPLOAD_MAX_CHARS)
+                        resumes.append(ScreeningInput(
+                            type="file",
+                            content=file_content,
+                            name=basename,
+                            source="uploaded_file"
+                        ))
                 except Exception as e:
                     raise gr.Error(f"Error reading resume file: {str(e)}")
             else:
@@ -412,12 +705,12 @@ class UnifiedResumeScreener:
         
         elif resume_input_type == "paste_text":
             if resume_text.strip():
-                resumes.append({
-                    "type": "text",
-                    "content": resume_text,
-                    "name": "Pasted Resume",
-                    "source": "pasted_text"
-                })
+                resumes.append(ScreeningInput(
+                    type="text",
+                    content=resume_text,
+                    name="Pasted Resume",
+                    source="pasted_text"
+                ))
         
         elif resume_input_type == "google_drive":
             if resume_link.strip():
@@ -429,23 +722,27 @@ class UnifiedResumeScreener:
         elif resume_input_type == "csv_links":
             if resume_csv and hasattr(resume_csv, 'name') and resume_csv.name:
                 try:
-                    # Read CSV and extract links
-                    df = pd.read_csv(resume_csv.name)
-                    # Assuming first column contains links
-                    link_column = df.columns[0]
-                    for idx, link in enumerate(df[link_column]):
-                        if pd.notna(link) and str(link).strip():
-                            # Use unified resume link processing
-                            processed = self.process_resume_link(link, idx)
-                            if processed:
-                                resumes.append(processed)
+                    # Stream the CSV row by row; the first row is a header
+                    with open(resume_csv.name, newline='', encoding='utf-8-sig') as f:
+                        reader = csv.reader(f)
+                        next(reader, None)
+                        # Assuming first column contains links
+                        rows = [(idx, row[0]) for idx, row in enumerate(reader) if row and row[0].strip()]
+                    
+                    # Download the unique Google Docs concurrently; processing below reads the results
+                    docs = self._prefetch_google_docs(link for _, link in rows)
+                    for idx, link in rows:
+                        # Use unified resume link processing
+                        processed = self.process_resume_link(link, idx, docs)
+                        if processed:
+                            resumes.append(processed)
                 except Exception as e:
                     raise gr.Error(f"Error reading CSV file: {str(e)}")
         
         return resumes
     
     def extract_job_descriptions(self, jd_input_type: str, jd_file=None, jd_text="", 
-                                jd_link="", jd_csv=None) -> List[Dict[str, str]]:
+                                jd_link="", jd_csv=None) -> List[ScreeningInput]:
         """Extract job descriptions based on input type"""
         job_descriptions = []
         
@@ -454,15 +751,15 @@ class UnifiedResumeScreener:
                 # Extract file content
                 try:
                     with open(jd_file.name, 'r', encoding='utf-8', errors='ignore') as f:
-                        file_content = f.read()
+                        file_content = f.read(TEXT_UPLOAD_MAX_CHARS)
                     # Use just the basename for display
                     basename = os.path.basename(jd_file.name)
-                    job_descriptions.append({
-                        "type": "file",
-                        "content": file_content,
-                        "name": basename,
-                        "source": "uploaded_file"
-                    })
+                    job_descriptions.append(ScreeningInput(
+                        type="file",
+                        content=file_content,
+                        name=basename,
+                        source="uploaded_file"
+                    ))
                 except Exception as e:
                     raise gr.Error(f"Error reading job description file: {str(e)}")
             else:
@@ -470,12 +767,12 @@ class UnifiedResumeScreener:
         
         elif jd_input_type == "paste_text":
             if jd_text.strip():
-                job_descriptions.append({
-                    "type": "text",
-                    "content": jd_text,
-                    "name": "Pasted Job Description",
-                    "source": "pasted_text"
-                })
+                job_descriptions.append(ScreeningInput(
+                    type="text",
+                    content=jd_text,
+                    name="Pasted Job Description",
+                    source="pasted_text"
+                ))
         
         elif jd_input_type == "link":
             if jd_link.strip():
@@ -487,27 +784,41 @@ class UnifiedResumeScreener:
         elif jd_input_type == "csv_links":
             if jd_csv and hasattr(jd_csv, 'name') and jd_csv.name:
                 try:
-                    # Read CSV and extract links
-                    df = pd.read_csv(jd_csv.name)
-                    # Assuming first column contains links
-                    link_column = df.columns[0]
-                    for idx, link in enumerate(df[link_column]):
-                        if pd.notna(link) and str(link).strip():
-                            # Use unified job description link processing
-                            processed = self.process_job_description_link(link, idx)
-                            if processed:
-                                job_descriptions.append(processed)
+                    # Stream the CSV row by row; the first row is a header
+                    with open(jd_csv.name, newline='', encoding='utf-8-sig') as f:
+                        reader = csv.reader(f)
+                        next(reader, None)
+                        # Assuming first column contains links
+                        rows = [(idx, row[0]) for idx, row in enumerate(reader) if row and row[0].strip()]
+                    
+                    # Fetch the unique job pages concurrently; processing below reads the results
+                    scraped = self._prefetch_job_pages(link for _, link in rows)
+                    for idx, link in rows:
+                        # Use unified job description link processing
+                        processed = self.process_job_description_link(link, idx, scraped)
+                        if processed:
+                            job_descriptions.append(processed)
                 except Exception as e:
                     raise gr.Error(f"Error reading CSV file: {str(e)}")
         
         return job_descriptions
     
     def download_google_doc_as_pdf(self, url: str) -> str:
-        """Download Google Doc as PDF and extract text"""
+        """Download Google Doc as PDF and extract text (memoized per URL)"""
+        cached = self._cache_get(self._doc_cache, url)
+        if cached is not None:
+            return cached
+        
+        text = self._fetch_google_doc_text(url)
+        self._cache_put(self._doc_cache, url, text, SCRAPE_CACHE_SIZE)
+        return text
+    
+    def _fetch_google_doc_text(self, url: str) -> str:
+        """Export a public Google Doc as PDF and extract its text"""
         try:
             # Extract document ID from Google Doc URL
             if '/document/d/' in url:
-                doc_id_match = re.search(r'/document/d/([a-zA-Z0-9-_]+)', url)
+                doc_id_match = _GOOGLE_DOC_ID_RE.search(url)
                 if doc_id_match:
                     doc_id = doc_id_match.group(1)
                 else:
@@ -518,19 +829,16 @@ class UnifiedResumeScreener:
             # Convert to PDF export URL
             pdf_export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=pdf"
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
             # Download the PDF
-            response = requests.get(pdf_export_url, headers=headers, timeout=15)
+            with self._host_slot(pdf_export_url):
+                response = self._get_http_session().get(pdf_export_url, timeout=15)
             response.raise_for_status()
             
             # Check if we got a PDF (not an error page)
             if response.headers.get('content-type', '').startswith('application/pdf'):
                 # Extract text from the PDF
                 pdf_content = response.content
-                return self.extract_pdf_text(pdf_content.decode('latin-1'))
+                return self.extract_pdf_text(pdf_content)
             else:
                 # If we didn't get a PDF, the document might not be publicly accessible
                 raise ValueError("Google Doc is not publicly accessible. Please make sure the document is shared with 'Anyone with the link can view' permissions.")
@@ -538,53 +846,83 @@ class UnifiedResumeScreener:
         except Exception as e:
             raise gr.Error(f"Error downloading Google Doc: {str(e)}")
     
+    def _prefetch_job_pages(self, links) -> Dict[str, Any]:
+        """Scrape each distinct job page URL once, in parallel; returns {url: result or error}"""
+        urls = list(dict.fromkeys(
+            link.strip() for link in links
+            if self._is_url(link.strip()) and 'drive.google.com/drive/folders/' not in link
+        ))
+        return self._warm_memo(self.scrape_job_description, urls)
+    
+    def _prefetch_google_docs(self, links) -> Dict[str, Any]:
+        """Download each distinct Google Doc once, in parallel; returns {url: text or error}"""
+        urls = list(dict.fromkeys(link.strip() for link in links if self._is_google_doc(link.strip())))
+        return self._warm_memo(self.download_google_doc_as_pdf, urls)
+    
+    def _warm_memo(self, fetch, urls: List[str]) -> Dict[str, Any]:
+        """Call a memoized fetch once per URL on a thread pool; returns {url: result or exception}"""
+        if not urls:
+            return {}
+        
+        def warm(url):
+            try:
+                return fetch(url)
+            except Exception as e:
+                return e  # Reported per link when the CSV row is processed
+        
+        # The batch can outgrow the bounded memo, so callers read results from this dict
+        with ThreadPoolExecutor(max_workers=min(JD_SCRAPE_MAX_WORKERS, len(urls))) as executor:
+            return dict(zip(urls, executor.map(warm, urls)))
+    
+    @staticmethod
+    def _from_prefetch(prefetched: Optional[Dict[str, Any]], fetch, url: str):
+        """Return url's prefetched result (re-raising its error), falling back to fetch"""
+        if not prefetched or url not in prefetched:
+            return fetch(url)
+        result = prefetched[url]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
     def scrape_job_description(self, url: str) -> tuple[str, str]:
-        """Scrape job description from URL and extract job title"""
+        """Scrape job description from URL and extract job title (memoized per URL)"""
+        cached = self._cache_get(self._scrape_cache, url)
+        if cached is not None:
+            return cached
+        
+        scraped = self._fetch_job_description(url)
+        self._cache_put(self._scrape_cache, url, scraped, SCRAPE_CACHE_SIZE)
+        return scraped
+    
+    def _fetch_job_description(self, url: str) -> tuple[str, str]:
+        """Fetch a job posting and clean it down to text plus job title"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            # Stream the page and stop at the cap; ads and trackers can make job pages several MB
+            with self._host_slot(url), self._get_http_session().get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= JD_MAX_HTML_BYTES:
+                        break
+                encoding = response.encoding or 'utf-8'
             
             # Enhanced text extraction with better cleaning
-            text = response.text
+            text = b''.join(chunks)[:JD_MAX_HTML_BYTES].decode(encoding, errors='replace')
             
             # Try to extract job title from HTML title or meta tags first
-            job_title = self._extract_job_title_from_html(response.text)
+            job_title = self._extract_job_title_from_html(text)
             
-            # Remove JavaScript completely
-            text = re.sub(r'<script[^>]*>.*?</script>', ' ', text, flags=re.DOTALL)
-            text = re.sub(r'function\s+\w+\s*\([^)]*\)\s*\{[^}]*\}', ' ', text, flags=re.DOTALL)
-            text = re.sub(r'window\.\w+\s*=\s*\w+\(\);', ' ', text)
-            text = re.sub(r'p\.resolve\s*=\s*\w+;', ' ', text)
-            text = re.sub(r'p\.reject\s*=\s*\w+;', ' ', text)
-            
-            # Remove HTML tags
-            text = re.sub(r'<[^>]+>', ' ', text)
+            # Strip scripts, styles and tags
+            text = self._html_to_text(text)
             
             # Remove common LinkedIn UI text
-            text = re.sub(r'Skip to main content', ' ', text)
-            text = re.sub(r'Expand search.*?current selection\.', ' ', text, flags=re.DOTALL)
-            text = re.sub(r'Jobs People Learning', ' ', text)
-            text = re.sub(r'Clear text', ' ', text)
-            text = re.sub(r'Join now Sign in', ' ', text)
-            text = re.sub(r'Apply Join or sign in to find your next job', ' ', text)
-            text = re.sub(r'Join to apply for.*?role at', ' ', text)
-            text = re.sub(r'Not you\?', ' ', text)
-            text = re.sub(r'Remove photo', ' ', text)
-            text = re.sub(r'First name Last name Email Password.*?Cookie Policy', ' ', text, flags=re.DOTALL)
-            text = re.sub(r'Continue Agree & Join', ' ', text)
-            text = re.sub(r'You may also apply directly on company website', ' ', text)
-            text = re.sub(r'Security verification', ' ', text)
-            text = re.sub(r'Already on LinkedIn\? Sign in', ' ', text)
-            text = re.sub(r'\d+ hours ago', ' ', text)
-            text = re.sub(r'Over \d+ applicants', ' ', text)
-            text = re.sub(r'See who.*?hired for', ' ', text)
+            text = _LINKEDIN_NOISE_RE.sub(' ', text)
             
             # Clean up whitespace and normalize
-            text = re.sub(r'\s+', ' ', text)
-            text = re.sub(r'[^\w\s\.\,\-\!\?\:\;\(\)\[\]\@\#]', ' ', text)  # Keep readable characters
+            text = _UNREADABLE_CHARS_RE.sub(' ', ' '.join(text.split()))  # Keep readable characters
             text = text.strip()
             
             # If we didn't get a job title from HTML, try to extract it from the text content
@@ -594,11 +932,10 @@ class UnifiedResumeScreener:
             # Extract meaningful content (look for job-related keywords)
             lines = text.split('.')
             meaningful_lines = []
-            job_keywords = ['hiring', 'job', 'position', 'role', 'responsibilities', 'requirements', 'qualifications', 'experience', 'skills']
             
             for line in lines:
                 line = line.strip()
-                if len(line) > 20 and any(keyword in line.lower() for keyword in job_keywords):
+                if len(line) > 20 and _JOB_KEYWORD_RE.search(line):
                     meaningful_lines.append(line)
             
             if meaningful_lines:
@@ -612,32 +949,44 @@ class UnifiedResumeScreener:
         except Exception as e:
             raise gr.Error(f"Error scraping job description: {str(e)}")
     
+    def _html_to_text(self, html_content: str) -> str:
+        """Visible text of an HTML page (lxml when available, regex fallback)"""
+        if LXML_AVAILABLE:
+            try:
+                tree = lxml.html.fromstring(html_content)
+                # Scripts and site navigation/footers are never part of the posting
+                for element in tree.xpath('//script | //style | //noscript | //nav | //footer'):
+                    element.drop_tree()
+                return ' '.join(' '.join(tree.itertext()).split())
+            except (ParserError, ValueError):
+                pass  # Empty or unparsable document; use the regex path
+        
+        # Remove JavaScript completely
+        text = _SCRIPT_BLOCK_RE.sub(' ', html_content)
+        text = _JS_SNIPPET_RE.sub(' ', text)
+        
+        # Remove HTML tags
+        return _HTML_TAG_RE.sub(' ', text)
+    
     def _extract_job_title_from_html(self, html_content: str) -> str:
         """Extract job title from HTML title and meta tags"""
         try:
             # Look for title tag
-            title_match = re.search(r'<title[^>]*>(.*?)</title>', html_content, re.IGNORECASE | re.DOTALL)
+            title_match = _HTML_TITLE_RE.search(html_content)
             if title_match:
                 title = title_match.group(1).strip()
                 # Clean up common LinkedIn title patterns
-                title = re.sub(r'\s*-\s*LinkedIn', '', title, flags=re.IGNORECASE)
-                title = re.sub(r'\s*-\s*Jobs', '', title, flags=re.IGNORECASE)
-                title = re.sub(r'\s*-\s*Job Search', '', title, flags=re.IGNORECASE)
+                title = _TITLE_SITE_SUFFIX_RE.sub('', title)
                 if title and len(title) > 5:
                     return title[:100]  # Limit length
             
             # Look for meta description
-            meta_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', html_content, re.IGNORECASE)
+            meta_match = _META_DESCRIPTION_RE.search(html_content)
             if meta_match:
                 description = meta_match.group(1).strip()
                 # Look for job title patterns in description
-                job_patterns = [
-                    r'(?:hiring|seeking|looking for)\s+([^.!?]+)',
-                    r'(?:position|role|job)\s+(?:of|as)\s+([^.!?]+)',
-                    r'([^.!?]*\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Director|Lead|Senior|Junior)[^.!?]*)'
-                ]
-                for pattern in job_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _META_TITLE_PATTERNS:
+                    match = pattern.search(description)
                     if match:
                         return match.group(1).strip()[:100]
             
@@ -657,15 +1006,8 @@ class UnifiedResumeScreener:
                     continue
                 
                 # Look for job title indicators
-                job_indicators = [
-                    r'(?:hiring|seeking|looking for)\s+([^.!?]+)',
-                    r'(?:position|role|job)\s+(?:of|as)\s+([^.!?]+)',
-                    r'([^.!?]*\s+(?:Engineer|Developer|Manager|Analyst|Specialist|Coordinator|Director|Lead|Senior|Junior|Architect|Consultant|Advisor)[^.!?]*)',
-                    r'([^.!?]*\s+(?:Software|Data|Product|Project|Business|Marketing|Sales|HR|Finance|Operations)[^.!?]*)'
-                ]
-                
-                for pattern in job_indicators:
-                    match = re.search(pattern, line, re.IGNORECASE)
+                for pattern in _TEXT_TITLE_PATTERNS:
+                    match = pattern.search(line)
                     if match:
                         title = match.group(1).strip()
                         if len(title) > 5 and len(title) < 100:
@@ -675,31 +1017,48 @@ class UnifiedResumeScreener:
         except:
             return ""
     
-    def process_single_resume_jd_pair(self, resume: Dict[str, str], job_desc: Dict[str, str]) -> Dict[str, Any]:
-        """Process a single resume against a single job description"""
+    def _resolve_jd_text(self, job_desc: ScreeningInput) -> str:
+        """Final text of an extracted job description (links are scraped during extraction)"""
+        if job_desc.type in ("text", "file"):
+            return job_desc.content
+        raise ValueError(f"Unknown job description type: {job_desc.type}")
+    
+    def _resolve_job_descriptions(self, job_descriptions: List[ScreeningInput]) -> List[Tuple[ScreeningInput, Optional[str]]]:
+        """Resolve every job description once, before pairing it with each resume"""
+        resolved = []
+        for job_desc in job_descriptions:
+            try:
+                resolved.append((job_desc, self._resolve_jd_text(job_desc)))
+            except ValueError:
+                resolved.append((job_desc, None))  # Re-raised and reported per pair
+        return resolved
+    
+    def process_single_resume_jd_pair(self, resume: ScreeningInput, job_desc: ScreeningInput,
+                                      job_description_text: Optional[str] = None) -> Dict[str, Any]:
+        """Process a single resume against a single job description (optionally pre-resolved)"""
+        # The LangGraph workflow (LangChain, OpenAI, Google clients) loads on first use
+        from resume_screener import resume_screening_workflow, ResumeScreeningState
+        
         try:
             # Prepare inputs for the workflow
-            if resume["type"] == "google_drive":
-                google_drive_link = resume["content"]
+            if resume.type == "google_drive":
+                google_drive_link = resume.content
                 resume_text = None
-            elif resume["type"] == "text":
+            elif resume.type == "text":
                 # For text input, we'll create a temporary file or handle differently
                 # For now, we'll use a placeholder - this needs enhancement
                 google_drive_link = ""
-                resume_text = resume["content"]
-            elif resume["type"] == "file":
+                resume_text = resume.content
+            elif resume.type == "file":
                 # For file uploads, use the extracted content
                 google_drive_link = ""
-                resume_text = resume["content"]
+                resume_text = resume.content
             else:
                 google_drive_link = ""
                 resume_text = ""
             
-            # All job descriptions are now processed to have type "text"
-            if job_desc["type"] == "text":
-                job_description_text = job_desc["content"]
-            else:
-                raise ValueError(f"Unknown job description type: {job_desc['type']}")
+            if job_description_text is None:
+                job_description_text = self._resolve_jd_text(job_desc)
             
             # Initialize state
             initial_state = ResumeScreeningState(
@@ -715,16 +1074,23 @@ class UnifiedResumeScreener:
                 error=None
             )
             
-            # Run the workflow
-            result = resume_screening_workflow.invoke(initial_state)
+            # Run the workflow, reusing the result for an identical resume/JD pair
+            cache_key = hashlib.sha256(
+                "\0".join((google_drive_link, resume_text or "", job_description_text)).encode()
+            ).hexdigest()
+            result = self._cache_get(self._workflow_cache, cache_key)
+            if result is None:
+                result = resume_screening_workflow.invoke(initial_state)
+                if not result.get("error"):
+                    self._cache_put(self._workflow_cache, cache_key, result, WORKFLOW_CACHE_SIZE)
             
             if result.get("error"):
                             return {
                 "success": False,
-                "error": f"{result['error']} (Resume: {resume.get('content', 'N/A')[:50]}...)",
-                "resume_name": resume["name"],
-                "jd_name": job_desc["name"],
-                "jd_original_url": job_desc.get("original_url", "")
+                "error": f"{result['error']} (Resume: {resume.content[:50]}...)",
+                "resume_name": resume.name,
+                "jd_name": job_desc.name,
+                "jd_original_url": job_desc.original_url
             }
             
             # Format results
@@ -732,16 +1098,16 @@ class UnifiedResumeScreener:
             candidate_info = result["candidate_info"]
             
             # Use the resume content (now properly extracted for PDFs)
-            resume_content = resume.get("content", "")
+            resume_content = resume.content
             
             return {
                 "success": True,
-                "resume_name": resume["name"],
-                "resume_source": resume["source"],
+                "resume_name": resume.name,
+                "resume_source": resume.source,
                 "resume_content": resume_content,
-                "jd_name": job_desc["name"],
-                "jd_source": job_desc["source"],
-                "jd_original_url": job_desc.get("original_url", ""),  # Add original URL
+                "jd_name": job_desc.name,
+                "jd_source": job_desc.source,
+                "jd_original_url": job_desc.original_url,  # Add original URL
                 "jd_content": job_description_text,
                 "candidate_info": candidate_info,
                 "screening_results": {
@@ -758,11 +1124,84 @@ class UnifiedResumeScreener:
         except Exception as e:
             return {
                 "success": False,
-                "error": f"Processing failed: {str(e)} (Resume: {resume.get('content', 'N/A')[:50]}...)",
-                "resume_name": resume["name"],
-                "jd_name": job_desc["name"],
-                "jd_original_url": job_desc.get("original_url", "")
+                "error": f"Processing failed: {str(e)} (Resume: {resume.content[:50]}...)",
+                "resume_name": resume.name,
+                "jd_name": job_desc.name,
+                "jd_original_url": job_desc.original_url
+            }
+    
+    def _validate_pair(self, resume: ScreeningInput, job_desc: ScreeningInput,
+                       job_description_text: Optional[str]) -> Optional[str]:
+        """Why a pair cannot be screened, or None when it is worth a workflow run"""
+        if resume.source == "error":
+            return resume.content or "Resume could not be loaded"
+        if resume.type not in ("google_drive", "text", "file") or not str(resume.content or "").strip():
+            return f"Resume has no usable content: {resume.name}"
+        if job_desc.source == "error":
+            return job_desc.content or "Job description could not be loaded"
+        if job_description_text is not None and not job_description_text.strip():
+            return f"Job description is empty: {job_desc.name}"
+        return None
+    
+    def iter_pair_results(self, resumes: List[ScreeningInput],
+                          job_descriptions: List[ScreeningInput]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Screen every resume x JD pair concurrently, yielding (matrix index, result) as each completes"""
+        resolved_jds = self._resolve_job_descriptions(job_descriptions)
+        pairs = [(resume, job_desc, jd_text) for resume in resumes for job_desc, jd_text in resolved_jds]
+        if not pairs:
+            return
+        
+        # Fail unusable pairs up front instead of spending a workflow run (and LLM call) on them
+        valid = []
+        for index, pair in enumerate(pairs):
+            error = self._validate_pair(*pair)
+            if error:
+                resume, job_desc, _ = pair
+                yield index, {
+                    "success": False,
+                    "error": error,
+                    "resume_name": resume.name,
+                    "jd_name": job_desc.name,
+                    "jd_original_url": job_desc.original_url
+                }
+            else:
+                valid.append((index, pair))
+        if not valid:
+            return
+        
+        # Pairs with the same resume and JD content (repeated CSV rows) are screened once
+        groups: Dict[str, List[Tuple[int, tuple]]] = {}
+        for index, pair in valid:
+            groups.setdefault(self._pair_key(*pair), []).append((index, pair))
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+            futures = {
+                executor.submit(self.process_single_resume_jd_pair, *members[0][1]): members
+                for members in groups.values()
             }
+            for future in as_completed(futures):
+                result = future.result()
+                members = futures[future]
+                yield members[0][0], result
+                for index, (resume, job_desc, _) in members[1:]:
+                    yield index, self._relabel_result(result, resume, job_desc)
+    
+    def _pair_key(self, resume: ScreeningInput, job_desc: ScreeningInput,
+                  job_description_text: Optional[str]) -> str:
+        """Fingerprint of what a pair actually screens, ignoring display names"""
+        jd_content = job_description_text if job_description_text is not None else job_desc.content
+        return hashlib.blake2b(
+            "\0".join((resume.type, resume.content, job_desc.type, jd_content)).encode(), digest_size=16
+        ).hexdigest()
+    
+    def _relabel_result(self, result: Dict[str, Any], resume: ScreeningInput,
+                        job_desc: ScreeningInput) -> Dict[str, Any]:
+        """Copy of a pair result under another pair's resume/JD names and sources"""
+        relabeled = dict(result, resume_name=resume.name, jd_name=job_desc.name,
+                         jd_original_url=job_desc.original_url)
+        if relabeled.get("success"):
+            relabeled.update(resume_source=resume.source, jd_source=job_desc.source)
+        return relabeled
     
     def process_matrix(self, resume_input_type: str, jd_input_type: str, 
                       resume_file=None, resume_text="", resume_link="", resume_csv=None,
@@ -778,34 +1217,33 @@ class UnifiedResumeScreener:
             if not job_descriptions:
                 raise gr.Error("No job descriptions provided")
             
-            # Process all combinations
-            results = []
+            # Process all combinations concurrently; each pair is dominated by network/LLM latency
             total_combinations = len(resumes) * len(job_descriptions)
-            processed = 0
+            results = [None] * total_combinations
             
-            for resume in resumes:
-                for job_desc in job_descriptions:
-                    result = self.process_single_resume_jd_pair(resume, job_desc)
-                    results.append(result)
-                    processed += 1
+            # Log about 20 progress checkpoints rather than one line per pair
+            log_every = max(1, total_combinations // 20)
+            for processed, (index, result) in enumerate(self.iter_pair_results(resumes, job_descriptions), 1):
+                results[index] = result
+                if processed % log_every == 0 or processed == total_combinations:
                     logger.info(f"Processed {processed}/{total_combinations}")
             
             # Generate results table and CSV
             table_html = self.create_results_table(results)
-            csv_data = self.create_csv_export(results)
             
-            # Write CSV to a temporary file for download
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
-            tmp.write(csv_data.encode("utf-8"))
-            tmp.close()
-            csv_path = tmp.name
+            # Stream the CSV rows straight into a file for download
+            csv_path = self.export_csv_file(results, os.path.join(self.workdir, f"results_{uuid.uuid4().hex}.csv"))
+            
+            # The CSV text is only read back for callers that want it inline
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                csv_data = f.read()
             
             return table_html, csv_data, csv_path
         except Exception as e:
             error_html = f"""
             <div style="color: red; padding: 20px; border: 1px solid red; border-radius: 5px;">
                 <h3>Error</h3>
-                <p>{str(e)}</p>
+                <p>{html_escape(str(e))}</p>
             </div>
             """
             return error_html, "", ""
@@ -813,19 +1251,23 @@ class UnifiedResumeScreener:
     def create_results_table(self, results: List[Dict[str, Any]]) -> str:
         """Create HTML table for results display"""
         if not results:
-            return "<p>No results to display.</p>"
+            return _NO_RESULTS_HTML
         
+        return self.assemble_results_table(results, [self.render_result_row(result) for result in results])
+    
+    def assemble_results_table(self, results: List[Dict[str, Any]], rows: List[str]) -> str:
+        """Wrap already-rendered result rows in the summary shell and footer"""
+        # Collect fragments and join once; repeated str += is quadratic in the row count
+        return ''.join([self._render_shell(results), *rows, _TABLE_FOOT])
+    
+    def _render_shell(self, results: List[Dict[str, Any]]) -> str:
+        """Heading and summary stats that open the results table"""
         # Summary stats
         total_results = len(results)
         successful_results = sum(1 for r in results if r.get("success", False))
         failed_results = total_results - successful_results
         
-        html = f"""
-        <div style="font-family: Arial, sans-serif; max-width: 1200px; margin: 0 auto;">
-            <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
-                Resume Screening Results
-            </h2>
-            
+        return f"""{_TABLE_HEAD}
             <div style="background: #ecf0f1; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
                 <h3 style="color: #2c3e50; margin-top: 0;">Summary</h3>
                 <p><strong>Total Analyses:</strong> {total_results} | <strong>Successful:</strong> {successful_results} | <strong>Failed:</strong> {failed_results}</p>
@@ -833,185 +1275,162 @@ class UnifiedResumeScreener:
             
             <div style="margin-top: 20px;">
         """
+    
+    def render_result_row(self, result: Dict[str, Any]) -> str:
+        """HTML card for one result"""
+        # Names, sources and errors come from uploads, CSVs, scraped pages and exceptions; escape them all
+        resume_name = html_escape(str(result.get('resume_name', 'Unknown')))
+        resume_source = html_escape(str(result.get('resume_source', 'Unknown')))
+        jd_name = html_escape(str(result.get('jd_name', 'Unknown')))
+        jd_source = html_escape(str(result.get('jd_source', 'Unknown')))
         
-        for i, result in enumerate(results):
-            if result.get("success", False):
-                # Successful result
-                candidate_info = result["candidate_info"]
-                screening = result["screening_results"]
-                
-                # Clean and format resume content
-                resume_content = result.get('resume_content', 'No content available')
-                if resume_content and resume_content != 'No content available':
-                    # Format the content for display
-                    import re
-                    # Remove extra whitespace
-                    resume_content = re.sub(r'\s+', ' ', resume_content)
-                    resume_content = resume_content.strip()
-                    # Limit length for display
-                    if len(resume_content) > 2000:
-                        resume_content = resume_content[:2000] + "... [Content truncated for display]"
-                
-                # Clean and format job description content
-                jd_content = result.get('jd_content', 'No content available')
-                if jd_content and jd_content != 'No content available':
-                    # Remove HTML tags and JavaScript
-                    import re
-                    # Remove HTML tags
-                    jd_content = re.sub(r'<[^>]+>', ' ', jd_content)
-                    # Remove JavaScript
-                    jd_content = re.sub(r'<script[^>]*>.*?</script>', ' ', jd_content, flags=re.DOTALL)
-                    jd_content = re.sub(r'function\s+\w+\s*\([^)]*\)\s*\{[^}]*\}', ' ', jd_content)
-                    # Remove extra whitespace
-                    jd_content = re.sub(r'\s+', ' ', jd_content)
-                    jd_content = jd_content.strip()
-                    # Limit length for display
-                    if len(jd_content) > 2000:
-                        jd_content = jd_content[:2000] + "... [Content truncated for display]"
-                
-                # Create expandable sections for details
-                resume_details = f"""
-                <details style="margin-top: 10px;">
-                    <summary style="cursor: pointer; color: #3498db; font-weight: bold;">📄 View Resume Details</summary>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-top: 10px;">
+        if result.get("success", False):
+            # Successful result
+            candidate_info = result["candidate_info"]
+            screening = result["screening_results"]
+            
+            # Clean and format resume content
+            resume_content = result.get('resume_content', 'No content available')
+            if resume_content and resume_content != 'No content available':
+                resume_content = _display_resume_text(resume_content)
+            
+            # Clean and format job description content
+            jd_content = result.get('jd_content', 'No content available')
+            if jd_content and jd_content != 'No content available':
+                jd_content = _display_jd_text(jd_content)
+            
+            # Create expandable sections for details
+            resume_details = f"""
+                <details class="rs-details">
+                    <summary>📄 View Resume Details</summary>
+                    <div class="rs-panel">
                         <h4>Candidate Information</h4>
-                        <p><strong>Name:</strong> {candidate_info.get('first_name', 'N/A')} {candidate_info.get('last_name', 'N/A')}</p>
-                        <p><strong>Email:</strong> {candidate_info.get('email_address', 'N/A')}</p>
+                        <p><strong>Name:</strong> {html_escape(candidate_info.get('first_name', 'N/A'))} {html_escape(candidate_info.get('last_name', 'N/A'))}</p>
+                        <p><strong>Email:</strong> {html_escape(candidate_info.get('email_address', 'N/A'))}</p>
                         <h4>Resume Content</h4>
-                        <div style="background: white; padding: 15px; border-radius: 5px; border: 1px solid #ddd; max-height: 400px; overflow-y: auto; font-family: Arial, sans-serif; font-size: 13px; line-height: 1.5; white-space: pre-wrap;">{resume_content}</div>
+                        <div class="rs-text">{resume_content}</div>
                     </div>
                 </details>
                 """
-                
-                jd_details = f"""
-                <details style="margin-top: 10px;">
-                    <summary style="cursor: pointer; color: #3498db; font-weight: bold;">💼 View Job Description</summary>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-top: 10px;">
+            
+            jd_details = f"""
+                <details class="rs-details">
+                    <summary>💼 View Job Description</summary>
+                    <div class="rs-panel">
                         <h4>Job Description Content</h4>
-                        <div style="background: white; padding: 15px; border-radius: 5px; border: 1px solid #ddd; max-height: 400px; overflow-y: auto; font-family: Arial, sans-serif; font-size: 13px; line-height: 1.5; white-space: pre-wrap;">{jd_content}</div>
+                        <div class="rs-text">{jd_content}</div>
                     </div>
                 </details>
                 """
-                
-                # Create detailed analysis section
-                strengths_html = ""
-                if screening.get('strengths'):
-                    strengths_html = "".join([f"<li>{s}</li>" for s in screening['strengths']])
-                else:
-                    strengths_html = "<li>No strengths identified</li>"
-                
-                weaknesses_html = ""
-                if screening.get('weaknesses'):
-                    weaknesses_html = "".join([f"<li>{w}</li>" for w in screening['weaknesses']])
-                else:
-                    weaknesses_html = "<li>No weaknesses identified</li>"
-                
-                analysis_details = f"""
-                <details style="margin-top: 10px;">
-                    <summary style="cursor: pointer; color: #27ae60; font-weight: bold;">📊 View Full Analysis</summary>
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin-top: 10px;">
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
-                            <div style="background: #e8f5e8; padding: 10px; border-radius: 5px;">
-                                <h4 style="color: #27ae60; margin-top: 0; font-size: 14px;">Candidate Strengths</h4>
-                                <ul style="margin: 0; padding-left: 20px; font-size: 12px;">{strengths_html}</ul>
+            
+            # Create detailed analysis section
+            if screening.get('strengths'):
+                strengths_html = "<li>" + "</li>\n<li>".join(map(html_escape, screening['strengths'])) + "</li>"
+            else:
+                strengths_html = "<li>No strengths identified</li>"
+            
+            if screening.get('weaknesses'):
+                weaknesses_html = "<li>" + "</li>\n<li>".join(map(html_escape, screening['weaknesses'])) + "</li>"
+            else:
+                weaknesses_html = "<li>No weaknesses identified</li>"
+            
+            # Look up and escape the nested assessments once; the badge and the analysis both show them
+            rating = screening.get('overall_fit', 0)
+            risk = screening.get('risk_factor', {})
+            reward = screening.get('reward_factor', {})
+            risk_score = html_escape(risk.get('score', 'N/A'))
+            reward_score = html_escape(reward.get('score', 'N/A'))
+            
+            analysis_details = f"""
+                <details class="rs-details">
+                    <summary class="rs-analysis">📊 View Full Analysis</summary>
+                    <div class="rs-panel">
+                        <div class="rs-grid">
+                            <div class="rs-box rs-strengths">
+                                <h4>Candidate Strengths</h4>
+                                <ul>{strengths_html}</ul>
                             </div>
-                            <div style="background: #ffeaea; padding: 10px; border-radius: 5px;">
-                                <h4 style="color: #e74c3c; margin-top: 0; font-size: 14px;">Areas for Improvement</h4>
-                                <ul style="margin: 0; padding-left: 20px; font-size: 12px;">{weaknesses_html}</ul>
+                            <div class="rs-box rs-weaknesses">
+                                <h4>Areas for Improvement</h4>
+                                <ul>{weaknesses_html}</ul>
                             </div>
                         </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-bottom: 15px;">
-                            <div style="background: #fff3cd; padding: 10px; border-radius: 5px;">
-                                <h4 style="color: #856404; margin-top: 0; font-size: 14px;">Risk Assessment</h4>
-                                <p style="margin: 5px 0; font-size: 12px;"><strong>Score:</strong> {screening.get('risk_factor', {}).get('score', 'N/A')}</p>
-                                <p style="margin: 5px 0; font-size: 12px;"><strong>Explanation:</strong> {screening.get('risk_factor', {}).get('explanation', 'N/A')}</p>
+                        <div class="rs-grid">
+                            <div class="rs-box rs-risk">
+                                <h4>Risk Assessment</h4>
+                                <p><strong>Score:</strong> {risk_score}</p>
+                                <p><strong>Explanation:</strong> {html_escape(risk.get('explanation', 'N/A'))}</p>
                             </div>
-                            <div style="background: #d1ecf1; padding: 10px; border-radius: 5px;">
-                                <h4 style="color: #0c5460; margin-top: 0; font-size: 14px;">Reward Assessment</h4>
-                                <p style="margin: 5px 0; font-size: 12px;"><strong>Score:</strong> {screening.get('reward_factor', {}).get('score', 'N/A')}</p>
-                                <p style="margin: 5px 0; font-size: 12px;"><strong>Explanation:</strong> {screening.get('reward_factor', {}).get('explanation', 'N/A')}</p>
+                            <div class="rs-box rs-reward">
+                                <h4>Reward Assessment</h4>
+                                <p><strong>Score:</strong> {reward_score}</p>
+                                <p><strong>Explanation:</strong> {html_escape(reward.get('explanation', 'N/A'))}</p>
                             </div>
                         </div>
-                        <div style="background: #e3f2fd; padding: 10px; border-radius: 5px;">
-                            <h4 style="color: #1976d2; margin-top: 0; font-size: 14px;">Overall Assessment</h4>
-                            <p style="margin: 5px 0; font-size: 12px;"><strong>Fit Rating:</strong> <span style="font-size: 16px; font-weight: bold; color: #3498db;">{screening.get('overall_fit', 'N/A')}/10</span></p>
-                            <p style="margin: 5px 0; font-size: 12px;"><strong>Justification:</strong> {screening.get('justification', 'N/A')}</p>
+                        <div class="rs-box rs-overall">
+                            <h4>Overall Assessment</h4>
+                            <p><strong>Fit Rating:</strong> <span class="rs-fit">{rating}/10</span></p>
+                            <p><strong>Justification:</strong> {html_escape(screening.get('justification', 'N/A'))}</p>
                         </div>
                     </div>
                 </details>
                 """
-                
-                # Determine rating color based on score
-                rating = screening['overall_fit']
-                if rating >= 8:
-                    rating_color = "#27ae60"  # Green for high scores
-                    rating_bg = "#e8f5e8"
-                elif rating >= 6:
-                    rating_color = "#f39c12"  # Orange for medium scores
-                    rating_bg = "#fff3cd"
-                else:
-                    rating_color = "#e74c3c"  # Red for low scores
-                    rating_bg = "#ffeaea"
-                
-                html += f"""
-                    <div style="border: 1px solid #ddd; border-radius: 8px; margin-bottom: 20px; overflow: hidden;">
-                        <div style="background: #f8f9fa; padding: 15px; border-bottom: 1px solid #ddd;">
-                            <div style="display: grid; grid-template-columns: 1fr 1fr 120px; gap: 20px; align-items: center;">
+            
+            # Determine rating color based on score (schema-validated to 0-10)
+            rating_class = _RATING_CLASSES[rating]
+            
+            return f"""
+                    <div class="rs-card">
+                        <div class="rs-card-head">
+                            <div class="rs-head-grid">
                                 <div>
-                                    <strong style="color: #2c3e50;">{result['resume_name']}</strong><br>
-                                    <small style="color: #666;">Source: {result['resume_source']}</small>
+                                    <strong class="rs-name">{resume_name}</strong><br>
+                                    <small class="rs-source">Source: {resume_source}</small>
                                 </div>
                                 <div>
-                                    <strong style="color: #2c3e50;">{result['jd_name']}</strong><br>
-                                    <small style="color: #666;">Source: {result['jd_source']}</small>
+                                    <strong class="rs-name">{jd_name}</strong><br>
+                                    <small class="rs-source">Source: {jd_source}</small>
                                 </div>
-                                <div style="text-align: center; background: {rating_bg}; padding: 10px; border-radius: 5px; border: 2px solid {rating_color};">
-                                    <div style="font-size: 20px; font-weight: bold; color: {rating_color};">
+                                <div class="rs-rating {rating_class}">
+                                    <div class="rs-rating-value">
                                         {rating}/10
                                     </div>
-                                    <div style="font-size: 10px; color: #666; margin-top: 2px;">
-                                        Risk: {screening['risk_factor']['score']}<br>
-                                        Reward: {screening['reward_factor']['score']}
+                                    <div class="rs-rating-sub">
+                                        Risk: {risk_score}<br>
+                                        Reward: {reward_score}
                                     </div>
                                 </div>
                             </div>
                         </div>
-                        <div style="padding: 15px;">
+                        <div class="rs-card-body">
                             {resume_details}
                             {jd_details}
                             {analysis_details}
                         </div>
                     </div>
                 """
-            else:
-                # Failed result
-                html += f"""
-                    <div style="border: 1px solid #e74c3c; border-radius: 8px; margin-bottom: 20px; background: #fdf2f2;">
-                        <div style="background: #e74c3c; color: white; padding: 15px;">
-                            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; align-items: center;">
+        else:
+            # Failed result
+            return f"""
+                    <div class="rs-failed">
+                        <div class="rs-failed-head">
+                            <div class="rs-failed-grid">
                                 <div>
-                                    <strong>{result.get('resume_name', 'Unknown')}</strong><br>
-                                    <small>Source: {result.get('resume_source', 'Unknown')}</small>
+                                    <strong>{resume_name}</strong><br>
+                                    <small>Source: {resume_source}</small>
                                 </div>
                                 <div>
-                                    <strong>{result.get('jd_name', 'Unknown')}</strong><br>
-                                    <small>Source: {result.get('jd_source', 'Unknown')}</small>
+                                    <strong>{jd_name}</strong><br>
+                                    <small>Source: {jd_source}</small>
                                 </div>
                             </div>
                         </div>
-                        <div style="padding: 15px; color: #e74c3c;">
+                        <div class="rs-failed-body">
                             <strong>❌ Analysis Failed</strong><br>
-                            {result.get('error', 'Unknown error')}
+                            {html_escape(str(result.get('error', 'Unknown error')))}
                         </div>
                     </div>
                 """
-        
-        html += """
-            </div>
-        </div>
-        """
-        
-        return html
     
     def create_csv_export(self, results: List[Dict[str, Any]]) -> str:
         """Create CSV export data"""
@@ -1020,55 +1439,61 @@ class UnifiedResumeScreener:
         
         # Create CSV in memory
         output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'Resume Name', 'Resume Source', 'Job Description Name', 'Job Description Source', 'Job Description URL',
-            'Candidate First Name', 'Candidate Last Name', 'Candidate Email',
-            'Overall Fit Rating', 'Risk Score', 'Reward Score',
-            'Strengths', 'Weaknesses', 'Risk Explanation', 'Reward Explanation', 'Justification'
-        ])
-        
-        # Write data
-        for result in results:
-            if result.get("success", False):
-                candidate_info = result["candidate_info"]
-                screening = result["screening_results"]
-                
-                writer.writerow([
-                    result['resume_name'],
-                    result['resume_source'],
-                    result['jd_name'],
-                    result['jd_source'],
-                    result.get('jd_original_url', ''),  # Add job description URL
-                    candidate_info.get('first_name', ''),
-                    candidate_info.get('last_name', ''),
-                    candidate_info.get('email_address', ''),
-                    screening['overall_fit'],
-                    screening['risk_factor']['score'],
-                    screening['reward_factor']['score'],
-                    '; '.join(screening['strengths']),
-                    '; '.join(screening['weaknesses']),
-                    screening['risk_factor']['explanation'],
-                    screening['reward_factor']['explanation'],
-                    screening['justification']
-                ])
-            else:
-                writer.writerow([
-                    result.get('resume_name', ''),
-                    result.get('resume_source', ''),
-                    result.get('jd_name', ''),
-                    result.get('jd_source', ''),
-                    result.get('jd_original_url', ''),  # Add job description URL
-                    '', '', '', '', '', '', '', '', '', '', result.get('error', '')
-                ])
-        
+        self._write_csv(results, output)
         return output.getvalue()
+    
+    def export_csv_file(self, results: List[Dict[str, Any]], path: str) -> str:
+        """Write the CSV export straight to a file and return its path"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            self._write_csv(results, f)
+        return path
+    
+    def _write_csv(self, results: List[Dict[str, Any]], f) -> None:
+        """Write the CSV header and one row per result to a text file object"""
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, restval='')
+        writer.writeheader()
+        writer.writerows(self._csv_row(result) for result in results)
+    
+    def _csv_row(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """CSV row for one result; failed analyses only fill the names, URL and error"""
+        row = {
+            'Resume Name': result.get('resume_name', ''),
+            'Resume Source': result.get('resume_source', ''),
+            'Job Description Name': result.get('jd_name', ''),
+            'Job Description Source': result.get('jd_source', ''),
+            'Job Description URL': result.get('jd_original_url', ''),
+        }
+        if not result.get("success", False):
+            row['Justification'] = result.get('error', '')
+            return row
+        
+        candidate_info = result["candidate_info"]
+        screening = result["screening_results"]
+        risk = screening.get('risk_factor', {})
+        reward = screening.get('reward_factor', {})
+        row.update({
+            'Candidate First Name': candidate_info.get('first_name', ''),
+            'Candidate Last Name': candidate_info.get('last_name', ''),
+            'Candidate Email': candidate_info.get('email_address', ''),
+            'Overall Fit Rating': screening.get('overall_fit', 0),
+            'Risk Score': risk.get('score', ''),
+            'Reward Score': reward.get('score', ''),
+            'Strengths': '; '.join(screening.get('strengths', [])),
+            'Weaknesses': '; '.join(screening.get('weaknesses', [])),
+            'Risk Explanation': risk.get('explanation', ''),
+            'Reward Explanation': reward.get('explanation', ''),
+            'Justification': screening.get('justification', ''),
+        })
+        return row
+
+@lru_cache(maxsize=1)
+def _get_screener() -> UnifiedResumeScreener:
+    """The app's one screener; its HTTP session, memos and workdir outlive interface rebuilds"""
+    return UnifiedResumeScreener()
 
 def create_interface():
     """Create the Gradio interface"""
-    screener = UnifiedResumeScreener()
+    screener = _get_screener()
     
     with gr.Blocks(title="Unified Resume Screener", theme=gr.themes.Soft()) as interface:
         gr.Markdown("# 🎯 Unified Resume Screening System")
@@ -1207,7 +1632,6 @@ def create_interface():
         # Results
         with gr.Row():
             results_html = gr.HTML(label="Results")
-            csv_output = gr.Textbox(label="CSV Export Data", visible=False)
         
         # Download file component
         download_btn = gr.DownloadButton(
@@ -1217,32 +1641,36 @@ def create_interface():
         )
         
         # Event handlers for radio button changes
-        def update_resume_widgets(choice):
-            return (
-                gr.update(visible=choice == "upload_file"),  # resume_file
-                gr.update(visible=choice == "paste_text"),   # resume_text
-                gr.update(visible=choice == "google_drive"), # resume_link
-                gr.update(visible=choice == "csv_links")     # resume_csv
-            )
+        # Input method -> the widget that collects it; only the selected one is shown
+        resume_widgets = {
+            "upload_file": resume_file,
+            "paste_text": resume_text,
+            "google_drive": resume_link,
+            "csv_links": resume_csv,
+        }
+        jd_widgets = {
+            "upload_file": jd_file,
+            "paste_text": jd_text,
+            "link": jd_link,
+            "csv_links": jd_csv,
+        }
         
-        def update_jd_widgets(choice):
-            return (
-                gr.update(visible=choice == "upload_file"),  # jd_file
-                gr.update(visible=choice == "paste_text"),   # jd_text
-                gr.update(visible=choice == "link"),         # jd_link
-                gr.update(visible=choice == "csv_links")     # jd_csv
-            )
+        def widget_visibility(widgets):
+            """Change handler showing the widget for the chosen input method and hiding the rest"""
+            def update(choice):
+                return tuple(gr.update(visible=method == choice) for method in widgets)
+            return update
         
         resume_input_type.change(
-            fn=update_resume_widgets,
+            fn=widget_visibility(resume_widgets),
             inputs=[resume_input_type],
-            outputs=[resume_file, resume_text, resume_link, resume_csv]
+            outputs=list(resume_widgets.values())
         )
         
         jd_input_type.change(
-            fn=update_jd_widgets,
+            fn=widget_visibility(jd_widgets),
             inputs=[jd_input_type],
-            outputs=[jd_file, jd_text, jd_link, jd_csv]
+            outputs=list(jd_widgets.values())
         )
         
         # Process button handler with real-time updates
@@ -1274,16 +1702,10 @@ def create_interface():
                 
                 # If there are validation errors, show them
                 if validation_messages:
-                    error_html = f"""
-                    <div style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 8px; padding: 20px; margin: 10px 0;">
-                        <h3 style="color: #856404; margin-top: 0;">⚠️ Please Complete Your Input</h3>
-                        <p style="color: #856404; margin-bottom: 15px;">To start the analysis, please provide:</p>
-                        <ul style="color: #856404; margin: 0; padding-left: 20px;">
-                            {''.join(f'<li>{msg}</li>' for msg in validation_messages)}
-                        </ul>
-                    </div>
-                    """
-                    yield error_html, "", gr.update(visible=False)
+                    error_html = _INPUT_MISSING_HTML.format(
+                        items=''.join(f'<li>{msg}</li>' for msg in validation_messages)
+                    )
+                    yield error_html, gr.update(visible=False)
                     return
                 
                 # Extract resumes and job descriptions
@@ -1292,35 +1714,11 @@ def create_interface():
                 
                 # Check if we have valid data after extraction
                 if not resumes:
-                    error_html = f"""
-                    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
-                        <h3 style="color: #721c24; margin-top: 0;">📄 No Valid Resumes Found</h3>
-                        <p style="color: #721c24; margin-bottom: 10px;">Please check your resume input:</p>
-                        <ul style="color: #721c24; margin: 0; padding-left: 20px;">
-                            <li>Make sure the file is uploaded correctly</li>
-                            <li>Ensure the Google Doc is shared with "Anyone with the link can view"</li>
-                            <li>Check that the CSV file contains valid links</li>
-                            <li>Verify that pasted text is not empty</li>
-                        </ul>
-                    </div>
-                    """
-                    yield error_html, "", gr.update(visible=False)
+                    yield _NO_RESUMES_HTML, gr.update(visible=False)
                     return
                 
                 if not job_descriptions:
-                    error_html = f"""
-                    <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
-                        <h3 style="color: #721c24; margin-top: 0;">💼 No Valid Job Descriptions Found</h3>
-                        <p style="color: #721c24; margin-bottom: 10px;">Please check your job description input:</p>
-                        <ul style="color: #721c24; margin: 0; padding-left: 20px;">
-                            <li>Make sure the file is uploaded correctly</li>
-                            <li>Ensure the job posting URL is accessible</li>
-                            <li>Check that the CSV file contains valid links</li>
-                            <li>Verify that pasted text is not empty</li>
-                        </ul>
-                    </div>
-                    """
-                    yield error_html, "", gr.update(visible=False)
+                    yield _NO_JOB_DESCRIPTIONS_HTML, gr.update(visible=False)
                     return
                 
                 # Show analysis starting message
@@ -1335,57 +1733,44 @@ def create_interface():
                     <p style="color: #0c5460; margin: 0; font-style: italic;">This may take a few moments...</p>
                 </div>
                 """
-                yield start_message, "", gr.update(visible=False)
+                yield start_message, gr.update(visible=False)
                 
-                # Process all combinations with real-time updates
-                results = []
-                total_combinations = len(resumes) * len(job_descriptions)
+                # Process all combinations concurrently, with real-time updates as each one finishes
+                slots = [None] * total_combinations
+                rows = [None] * total_combinations
                 processed = 0
+                # About 20 progress updates per run; each one re-sends the whole page to the browser
+                update_every = max(1, total_combinations // 20)
                 
-                for resume in resumes:
-                    for job_desc in job_descriptions:
-                        result = screener.process_single_resume_jd_pair(resume, job_desc)
-                        results.append(result)
-                        processed += 1
-                        
-                        # Yield intermediate results for real-time updates
-                        if processed % 1 == 0:  # Update after each result
-                            table_html = screener.create_results_table(results)
-                            csv_data = screener.create_csv_export(results)
-                            yield table_html, csv_data, gr.update(visible=False)
+                for index, result in screener.iter_pair_results(resumes, job_descriptions):
+                    slots[index] = result
+                    # Render only the new card; earlier cards are reused as-is
+                    rows[index] = screener.render_result_row(result)
+                    processed += 1
+                    
+                    # Yield intermediate results (in matrix order) for real-time updates;
+                    # the last one is covered by the final yield below
+                    if processed % update_every == 0 and processed < total_combinations:
+                        table_html = screener.assemble_results_table(
+                            [r for r in slots if r is not None],
+                            [row for row in rows if row is not None]
+                        )
+                        yield table_html, gr.update(visible=False)
                 
                 # Final results with download button
-                table_html = screener.create_results_table(results)
-                csv_data = screener.create_csv_export(results)
+                results = slots
+                table_html = screener.assemble_results_table(results, rows)
                 
-                # Create temporary CSV file for download
+                # Write the CSV straight to a temporary file with the actual desired filename
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 csv_filename = f"resume_screening_results_{timestamp}.csv"
+                csv_filepath = screener.export_csv_file(results, os.path.join(screener.workdir, csv_filename))
                 
-                # Write CSV to temporary file with the actual desired filename
-                import os
-                temp_dir = tempfile.gettempdir()
-                csv_filepath = os.path.join(temp_dir, csv_filename)
-                
-                with open(csv_filepath, 'w', encoding='utf-8') as f:
-                    f.write(csv_data)
-                
-                yield table_html, csv_data, gr.update(visible=True, value=csv_filepath)
+                yield table_html, gr.update(visible=True, value=csv_filepath)
                 
             except Exception as e:
-                error_html = f"""
-                <div style="background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 8px; padding: 20px; margin: 10px 0;">
-                    <h3 style="color: #721c24; margin-top: 0;">❌ Analysis Failed</h3>
-                    <p style="color: #721c24; margin-bottom: 10px;">An unexpected error occurred during processing:</p>
-                    <div style="background-color: #f8f9fa; border: 1px solid #dee2e6; border-radius: 4px; padding: 10px; margin: 10px 0;">
-                        <code style="color: #721c24;">{str(e)}</code>
-                    </div>
-                    <p style="color: #721c24; margin: 0; font-size: 14px;">
-                        Please check your inputs and try again. If the problem persists, try using different input methods.
-                    </p>
-                </div>
-                """
-                yield error_html, "", gr.update(visible=False)
+                error_html = _ANALYSIS_FAILED_HTML.format(error=html_escape(str(e)))
+                yield error_html, gr.update(visible=False)
         
         process_btn.click(
             fn=process_and_display,
@@ -1393,19 +1778,25 @@ def create_interface():
                 resume_input_type, resume_file, resume_text, resume_link, resume_csv,
                 jd_input_type, jd_file, jd_text, jd_link, jd_csv
             ],
-            outputs=[results_html, csv_output, download_btn]
+            outputs=[results_html, download_btn]
         )
     
     return interface
 
 def main():
     """Main function to run the application"""
+    from starlette.middleware import Middleware
+    from starlette.middleware.gzip import GZipMiddleware
+    
     interface = create_interface()
     interface.launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
-        show_error=True
+        show_error=True,
+        # The instructions and result HTML are large, highly compressible text;
+        # Starlette leaves text/event-stream responses uncompressed
+        app_kwargs={"middleware": [Middleware(GZipMiddleware, minimum_size=1024)]}
     )
 
 if __name__ == "__main__":